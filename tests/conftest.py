@@ -0,0 +1,123 @@
+"""
+Shared fixtures for the Zoho Books MCP test suite.
+
+The mock API payloads in tests/payloads.py are handed out through
+session-scoped fixtures, so tests share a single instance instead of
+rebuilding the same dicts per test. The API client fixtures swap each tool
+module's zoho_api_request_async for an AsyncMock.
+"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from tests.payloads import (
+    MOCK_EXPENSE,
+    MOCK_EXPENSE_CREATE_RESPONSE,
+    MOCK_EXPENSE_GET_RESPONSE,
+    MOCK_EXPENSE_UPDATE_DATE_RESPONSE,
+    MOCK_EXPENSE_UPDATE_RESPONSE,
+    MOCK_EXPENSE_WITH_LINE_ITEMS_RESPONSE,
+    MOCK_EXPENSES_LIST,
+    MOCK_EXPENSES_LIST_SINGLE,
+    SAMPLE_ITEM,
+    SAMPLE_ITEM_LIST,
+    SAMPLE_ITEM_RESPONSE,
+)
+from zoho_mcp.tools import api
+
+
+@pytest.fixture(scope="session")
+def mock_expense():
+    """A single expense record."""
+    return MOCK_EXPENSE
+
+
+@pytest.fixture(scope="session")
+def mock_expenses_list():
+    """A two-expense list response."""
+    return MOCK_EXPENSES_LIST
+
+
+@pytest.fixture(scope="session")
+def mock_expenses_list_single():
+    """A list response containing only the first expense."""
+    return MOCK_EXPENSES_LIST_SINGLE
+
+
+@pytest.fixture(scope="session")
+def mock_expense_create_response():
+    """Response for a successful expense creation."""
+    return MOCK_EXPENSE_CREATE_RESPONSE
+
+
+@pytest.fixture(scope="session")
+def mock_expense_get_response():
+    """Response for a successful expense lookup."""
+    return MOCK_EXPENSE_GET_RESPONSE
+
+
+@pytest.fixture(scope="session")
+def mock_expense_update_response():
+    """Response for a successful expense update."""
+    return MOCK_EXPENSE_UPDATE_RESPONSE
+
+
+@pytest.fixture(scope="session")
+def mock_expense_with_line_items_response():
+    """Response for an expense created with two line items."""
+    return MOCK_EXPENSE_WITH_LINE_ITEMS_RESPONSE
+
+
+@pytest.fixture(scope="session")
+def mock_expense_update_date_response():
+    """Response for an expense update that changes the date."""
+    return MOCK_EXPENSE_UPDATE_DATE_RESPONSE
+
+
+@pytest.fixture(scope="session")
+def sample_item():
+    """A single item record."""
+    return SAMPLE_ITEM
+
+
+@pytest.fixture(scope="session")
+def sample_item_list():
+    """A one-item list response."""
+    return SAMPLE_ITEM_LIST
+
+
+@pytest.fixture(scope="session")
+def sample_item_response():
+    """Response for a successful single-item request."""
+    return SAMPLE_ITEM_RESPONSE
+
+
+@pytest.fixture
+def mock_expenses_api(monkeypatch):
+    """Replace the API client used by the expense tools with an AsyncMock."""
+    mock = AsyncMock()
+    monkeypatch.setattr("zoho_mcp.tools.expenses.zoho_api_request_async", mock)
+    return mock
+
+
+@pytest.fixture
+def mock_items_api(monkeypatch):
+    """Replace the API client used by the item tools with an AsyncMock."""
+    mock = AsyncMock()
+    monkeypatch.setattr("zoho_mcp.tools.items.zoho_api_request_async", mock)
+    return mock
+
+
+@pytest.fixture(autouse=True)
+def fresh_api_state(monkeypatch):
+    """Give every test its own shared API clients and caches, so patched state doesn't leak."""
+    monkeypatch.setattr("zoho_mcp.tools.api._async_client", None)
+    monkeypatch.setattr("zoho_mcp.tools.api._sync_client", None)
+    monkeypatch.setattr("zoho_mcp.tools.api._auth_client", None)
+    monkeypatch.setattr("zoho_mcp.tools.api._token_cache", {})
+    monkeypatch.setattr("zoho_mcp.tools.api._last_validation", None)
+    monkeypatch.setattr("zoho_mcp.tools.api._refresh_future", None)
+    monkeypatch.setattr("zoho_mcp.tools.api._refresh_count", 0)
+    api._response_cache.clear()
+    api._pending_requests.clear()
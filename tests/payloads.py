@@ -0,0 +1,141 @@
+"""
+Mock Zoho Books API payloads shared across the test suite.
+
+Payloads are built once at import as read-only mappings (with tuples for
+lists), so every test shares a single instance. conftest.py hands them out
+as session-scoped fixtures; tests that need a constant directly import it
+from here.
+"""
+
+from types import MappingProxyType
+
+
+# Expense payloads
+MOCK_EXPENSE_ID = "123456789"
+
+MOCK_EXPENSE = MappingProxyType({
+    "expense_id": MOCK_EXPENSE_ID,
+    "account_id": "account123",
+    "paid_through_account_id": "paid_account123",
+    "date": "2025-01-15",
+    "amount": 500.50,
+    "vendor_name": "ABC Supplies",
+    "vendor_id": "vendor123",
+    "is_billable": False,
+    "reference_number": "REF-001",
+    "description": "Office supplies",
+    "status": "unbilled",
+})
+
+MOCK_EXPENSES_PAGE_CONTEXT = MappingProxyType({
+    "page": 1,
+    "per_page": 25,
+    "has_more_page": False,
+    "report_name": "Expenses",
+    "applied_filter": "All Expenses",
+    "sort_column": "created_time",
+    "sort_order": "D",
+    "total": 2
+})
+
+MOCK_EXPENSES_LIST = MappingProxyType({
+    "expenses": (MOCK_EXPENSE, MappingProxyType({
+        "expense_id": "987654321",
+        "account_id": "account456",
+        "paid_through_account_id": "paid_account456",
+        "date": "2025-01-20",
+        "amount": 1000.00,
+        "vendor_name": "XYZ Services",
+        "vendor_id": "vendor456",
+        "is_billable": True,
+        "customer_id": "customer123",
+        "reference_number": "REF-002",
+        "description": "Consulting services",
+        "status": "invoiced",
+    })),
+    "page_context": MOCK_EXPENSES_PAGE_CONTEXT,
+    "message": "Expenses retrieved successfully",
+    "code": 0,
+})
+
+# Single-result variant returned by filtered list queries
+MOCK_EXPENSES_LIST_SINGLE = MappingProxyType(dict(MOCK_EXPENSES_LIST) | {
+    "expenses": (MOCK_EXPENSE,),
+    "page_context": MappingProxyType(dict(MOCK_EXPENSES_PAGE_CONTEXT) | {"total": 1}),
+})
+
+MOCK_EXPENSE_CREATE_RESPONSE = MappingProxyType({
+    "expense": MOCK_EXPENSE,
+    "message": "Expense created successfully",
+    "code": 0,
+})
+
+MOCK_EXPENSE_GET_RESPONSE = MappingProxyType({
+    "expense": MOCK_EXPENSE,
+    "message": "Expense retrieved successfully",
+    "code": 0,
+})
+
+MOCK_EXPENSE_UPDATE_RESPONSE = MappingProxyType({
+    "expense": MappingProxyType(dict(MOCK_EXPENSE) | {
+        "amount": 600.75,
+        "description": "Updated office supplies"
+    }),
+    "message": "Expense updated successfully",
+    "code": 0,
+})
+
+MOCK_EXPENSE_WITH_LINE_ITEMS_RESPONSE = MappingProxyType(dict(MOCK_EXPENSE_CREATE_RESPONSE) | {
+    "expense": MappingProxyType(dict(MOCK_EXPENSE) | {
+        "line_items": (
+            MappingProxyType({
+                "line_item_id": "item1",
+                "account_id": "account123",
+                "amount": 300.50,
+                "description": "Paper supplies"
+            }),
+            MappingProxyType({
+                "line_item_id": "item2",
+                "account_id": "account123",
+                "amount": 200.00,
+                "description": "Printer ink"
+            }),
+        )
+    })
+})
+
+# Update response variant for an expense moved to a new date
+MOCK_EXPENSE_UPDATE_DATE_RESPONSE = MappingProxyType(dict(MOCK_EXPENSE_UPDATE_RESPONSE) | {
+    "expense": MappingProxyType(
+        dict(MOCK_EXPENSE_UPDATE_RESPONSE["expense"]) | {"date": "2025-02-15"}
+    ),
+})
+
+
+# Item payloads
+SAMPLE_ITEM = MappingProxyType({
+    "item_id": "123456789",
+    "name": "Test Item",
+    "description": "Test item description",
+    "item_type": "service",
+    "rate": 100.0,
+    "status": "active",
+    "sku": "TST-001",
+    "tax_id": "1234",
+})
+
+SAMPLE_ITEM_LIST = MappingProxyType({
+    "items": (SAMPLE_ITEM,),
+    "page_context": MappingProxyType({
+        "page": 1,
+        "per_page": 25,
+        "has_more_page": False,
+        "total": 1
+    })
+})
+
+SAMPLE_ITEM_RESPONSE = MappingProxyType({
+    "item": SAMPLE_ITEM,
+    "code": 0,
+    "message": "Success"
+})
@@ -3,9 +3,10 @@ Tests for the Zoho Books API client module.
 """
 
 import json
+import os
 import time
 import pytest
-from unittest.mock import patch, mock_open, MagicMock
+from unittest.mock import AsyncMock, patch, mock_open, MagicMock
 from pathlib import Path
 
 import httpx
@@ -23,6 +24,7 @@ from zoho_mcp.tools.api import (
     ZohoRequestError,
     ZohoRateLimitError,
 )
+from zoho_mcp.errors import ResourceNotFoundError
 from zoho_mcp.config import settings
 
 
@@ -41,7 +43,7 @@ patch("mcp.server.fastmcp.FastMCP", MockFastMCP).start()
 # Test loading token from cache
 def test_load_token_from_cache_not_exists():
     """Test loading token when cache file doesn't exist."""
-    with patch.object(Path, "exists", return_value=False):
+    with patch("builtins.open", side_effect=FileNotFoundError):
         assert _load_token_from_cache() == {}
 
 
@@ -50,16 +52,20 @@ def test_load_token_from_cache_success():
     mock_token_data = {"access_token": "test_token", "expires_at": time.time() + 3600}
     
     with patch("builtins.open", mock_open(read_data=json.dumps(mock_token_data))):
-        with patch.object(Path, "exists", return_value=True):
-            loaded_token = _load_token_from_cache()
-            assert loaded_token == mock_token_data
+        loaded_token = _load_token_from_cache()
+        assert loaded_token == mock_token_data
 
 
 def test_load_token_from_cache_json_error():
     """Test handling of JSON decode error when loading token."""
     with patch("builtins.open", mock_open(read_data="invalid json")):
-        with patch.object(Path, "exists", return_value=True):
-            assert _load_token_from_cache() == {}
+        assert _load_token_from_cache() == {}
+
+
+def test_load_token_from_cache_io_error():
+    """Test handling of an unreadable cache file."""
+    with patch("builtins.open", side_effect=PermissionError("Permission denied")):
+        assert _load_token_from_cache() == {}
 
 
 # Test saving token to cache
@@ -114,13 +120,14 @@ def test_get_access_token_refresh_expired():
     
     # Create mock response data
     response_data = {"access_token": "new_token", "expires_in": 3600}
-    mock_response = MagicMock()
-    mock_response.json.return_value = response_data
-    mock_response.raise_for_status = MagicMock()
+    mock_response = httpx.Response(
+        200, json=response_data, request=httpx.Request("POST", "https://auth.url/token")
+    )
     
     with patch("zoho_mcp.tools.api._load_token_from_cache", mock_load):
         with patch("zoho_mcp.tools.api._save_token_to_cache", mock_save):
-            with patch("httpx.post", return_value=mock_response):
+            with patch("zoho_mcp.tools.api._get_auth_client") as mock_auth_client:
+                mock_auth_client.return_value.post.return_value = mock_response
                 # We need to patch these attributes too
                 with patch("zoho_mcp.tools.api.settings.ZOHO_CLIENT_ID", "client_id"):
                     with patch("zoho_mcp.tools.api.settings.ZOHO_CLIENT_SECRET", "client_secret"):
@@ -145,13 +152,14 @@ def test_get_access_token_refresh_force():
     
     # Create mock response data
     response_data = {"access_token": "new_token", "expires_in": 3600}
-    mock_response = MagicMock()
-    mock_response.json.return_value = response_data
-    mock_response.raise_for_status = MagicMock()
+    mock_response = httpx.Response(
+        200, json=response_data, request=httpx.Request("POST", "https://auth.url/token")
+    )
     
     with patch("zoho_mcp.tools.api._load_token_from_cache", mock_load):
         with patch("zoho_mcp.tools.api._save_token_to_cache", mock_save):
-            with patch("httpx.post", return_value=mock_response):
+            with patch("zoho_mcp.tools.api._get_auth_client") as mock_auth_client:
+                mock_auth_client.return_value.post.return_value = mock_response
                 # We need to patch these attributes too
                 with patch("zoho_mcp.tools.api.settings.ZOHO_CLIENT_ID", "client_id"):
                     with patch("zoho_mcp.tools.api.settings.ZOHO_CLIENT_SECRET", "client_secret"):
@@ -181,7 +189,8 @@ def test_get_access_token_error():
     
     with patch("zoho_mcp.tools.api.settings", mock_settings):
         with patch("zoho_mcp.tools.api._load_token_from_cache", return_value=mock_expired_token):
-            with patch("httpx.post") as mock_post:
+            with patch("zoho_mcp.tools.api._get_auth_client") as mock_auth_client:
+                mock_post = mock_auth_client.return_value.post
                 # Set up the mock post to raise an HTTPStatusError
                 error = httpx.HTTPStatusError(
                     "Test error",
@@ -252,6 +261,28 @@ def test_handle_api_error_no_json():
     assert "Bad request" in str(exc_info.value)
 
 
+@pytest.mark.parametrize(
+    "request_url, expected_message",
+    [
+        pytest.param(
+            "https://www.zohoapis.com/books/v3/invoices/123?organization_id=1",
+            "invoices with ID 123 not found.",
+            id="from_url",
+        ),
+        pytest.param(None, "Resource with ID unknown not found.", id="no_request"),
+    ],
+)
+def test_handle_api_error_not_found(request_url, expected_message):
+    """Test that 404s name the resource from the request URL."""
+    request = httpx.Request("GET", request_url) if request_url else None
+    response = httpx.Response(404, json={"message": "Not found"}, request=request)
+    
+    with pytest.raises(ResourceNotFoundError) as exc_info:
+        _handle_api_error(response)
+    
+    assert str(exc_info.value) == expected_message
+
+
 # Test API requests
 def test_zoho_api_request():
     """Test successful API request."""
@@ -260,9 +291,9 @@ def test_zoho_api_request():
     
     # Mock token retrieval
     with patch("zoho_mcp.tools.api._get_access_token", return_value="test_token"):
-        with patch("httpx.Client") as mock_client_cls:
+        with patch("httpx.AsyncClient") as mock_client_cls:
             mock_client = mock_client_cls.return_value
-            mock_client.__enter__.return_value.request.return_value = mock_response
+            mock_client.request = AsyncMock(return_value=mock_response)
             
             response = zoho_api_request(
                 method="GET",
@@ -270,10 +301,9 @@ def test_zoho_api_request():
             )
             
             assert response == {"data": "test"}
-            assert mock_client.__enter__.return_value.request.call_count == 1
+            assert mock_client.request.call_count == 1
 
 
-@pytest.mark.asyncio
 async def test_zoho_api_request_async():
     """Test successful async API request."""
     # Mock successful response
@@ -283,7 +313,7 @@ async def test_zoho_api_request_async():
     with patch("zoho_mcp.tools.api._get_access_token", return_value="test_token"):
         with patch("httpx.AsyncClient") as mock_client_cls:
             mock_client = mock_client_cls.return_value
-            mock_client.__aenter__.return_value.request.return_value = mock_response
+            mock_client.request = AsyncMock(return_value=mock_response)
             
             response = await zoho_api_request_async(
                 method="GET",
@@ -291,7 +321,84 @@ async def test_zoho_api_request_async():
             )
             
             assert response == {"data": "test"}
-            assert mock_client.__aenter__.return_value.request.call_count == 1
+            assert mock_client.request.call_count == 1
+
+
+async def test_zoho_api_request_async_headers():
+    """Test that each request sends auth, content type, request ID and extra headers."""
+    mock_response = httpx.Response(200, json={"data": "test"})
+    
+    with patch("zoho_mcp.tools.api._get_access_token", return_value="test_token"):
+        with patch("httpx.AsyncClient") as mock_client_cls:
+            mock_client = mock_client_cls.return_value
+            mock_client.request = AsyncMock(return_value=mock_response)
+            
+            await zoho_api_request_async(
+                method="POST",
+                endpoint="/test",
+                headers={"X-Custom": "1"},
+                request_id="req-1",
+            )
+            
+            sent_headers = mock_client.request.call_args.kwargs["headers"]
+            assert sent_headers == {
+                "Content-Type": "application/json",
+                "Authorization": "Zoho-oauthtoken test_token",
+                "X-Request-ID": "req-1",
+                "X-Custom": "1",
+            }
+
+
+async def test_zoho_api_request_async_generated_request_ids():
+    """Test that generated request IDs are unique per request."""
+    with patch("zoho_mcp.tools.api._get_access_token", return_value="test_token"):
+        with patch("httpx.AsyncClient") as mock_client_cls:
+            mock_client = mock_client_cls.return_value
+            mock_client.request = AsyncMock(
+                side_effect=lambda **kwargs: httpx.Response(204)
+            )
+            
+            await zoho_api_request_async(method="DELETE", endpoint="/test/1")
+            await zoho_api_request_async(method="DELETE", endpoint="/test/2")
+            
+            first, second = (
+                call.kwargs["headers"]["X-Request-ID"]
+                for call in mock_client.request.call_args_list
+            )
+            assert first.startswith(f"zoho-{os.getpid():x}-")
+            assert first != second
+
+
+@pytest.mark.parametrize(
+    "mock_response, expected",
+    [
+        pytest.param(
+            httpx.Response(204),
+            {"status": "success", "message": "Operation completed successfully"},
+            id="no_content",
+        ),
+        pytest.param(
+            httpx.Response(200, text="<html>Maintenance</html>", headers={"Content-Type": "text/html"}),
+            {"text": "<html>Maintenance</html>"},
+            id="html",
+        ),
+        pytest.param(
+            httpx.Response(200, content=b"not json", headers={"Content-Type": "application/json"}),
+            {"text": "not json"},
+            id="invalid_json",
+        ),
+    ],
+)
+async def test_zoho_api_request_async_non_json(mock_response, expected):
+    """Test responses that carry no JSON body."""
+    with patch("zoho_mcp.tools.api._get_access_token", return_value="test_token"):
+        with patch("httpx.AsyncClient") as mock_client_cls:
+            mock_client = mock_client_cls.return_value
+            mock_client.request = AsyncMock(return_value=mock_response)
+            
+            response = await zoho_api_request_async(method="DELETE", endpoint="/test/1")
+            
+            assert response == expected
 
 
 # Test credential validation
@@ -364,4 +471,23 @@ def test_validate_credentials_auth_error():
             assert success is False
             assert "Invalid credentials" in error
             # Verify validate was called
-            mock_settings.validate.assert_called_once()
\ No newline at end of file
+            mock_settings.validate.assert_called_once()
+
+
+def test_validate_credentials_cached():
+    """Test that a successful validation is reused until the credentials change."""
+    mock_settings = MagicMock()
+    mock_settings.ZOHO_REFRESH_TOKEN = "refresh_token"
+    api_response = {"organizations": [{"organization_id": "test_org_id"}]}
+    
+    with patch("zoho_mcp.tools.api.settings", mock_settings):
+        with patch("zoho_mcp.tools.api.ORG_ID", "test_org_id"):
+            with patch("zoho_mcp.tools.api._get_access_token", return_value="test_token"):
+                with patch("zoho_mcp.tools.api.zoho_api_request", return_value=api_response) as mock_request:
+                    assert validate_credentials() == (True, None)
+                    assert validate_credentials() == (True, None)
+                    assert mock_request.call_count == 1
+                    
+                    mock_settings.ZOHO_REFRESH_TOKEN = "new_refresh_token"
+                    assert validate_credentials() == (True, None)
+                    assert mock_request.call_count == 2
@@ -2,25 +2,40 @@
 Test suite for API enhancements: caching and rate limiting.
 """
 
+import asyncio
+import threading
+import time
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
 
 import httpx
 
 from zoho_mcp.tools.api import (
     _generate_cache_key,
+    _json_dumps,
+    _json_loads,
     _get_cached_response,
     _set_cached_response,
     clear_cache,
     _handle_rate_limit_async,
     _check_global_rate_limit,
+    _get_async_client,
+    _get_access_token,
+    _get_access_token_async,
+    _save_token_to_cache,
+    close_clients,
+    zoho_api_request,
     zoho_api_request_async,
     _response_cache,
     MAX_RETRIES,
+    MAX_RETRY_AFTER,
     INITIAL_BACKOFF,
     BACKOFF_MULTIPLIER,
 )
+from zoho_mcp.tools.api import ZohoAuthenticationError
 import zoho_mcp.tools.api as api_module
 
 
@@ -94,20 +109,17 @@ class TestCaching:
         # Cache entry should be removed
         assert cache_key not in _response_cache
     
-    @pytest.mark.asyncio
     async def test_caching_in_api_request(self, monkeypatch):
         """Test that caching works in the actual API request function."""
         # Mock the HTTP client
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"invoices": [{"id": 1}]}
+        mock_response = httpx.Response(200, json={"invoices": [{"id": 1}]})
         
-        mock_client = AsyncMock()
+        mock_client = MagicMock()
         mock_client.request = AsyncMock(return_value=mock_response)
         
         # Mock httpx.AsyncClient to return our mock client
         with patch("httpx.AsyncClient") as mock_async_client:
-            mock_async_client.return_value.__aenter__.return_value = mock_client
+            mock_async_client.return_value = mock_client
             
             # Mock token retrieval
             with patch("zoho_mcp.tools.api._get_access_token", return_value="test_token"):
@@ -124,6 +136,29 @@ class TestCaching:
                 # Request with different parameters should hit API again
                 result3 = await zoho_api_request_async("GET", "/invoices", params={"page": 2})
                 assert mock_client.request.call_count == 2
+    
+    async def test_concurrent_identical_gets_share_one_request(self):
+        """Test that identical GETs in flight at the same time send a single request."""
+        release = asyncio.Event()
+        
+        async def slow_request(**kwargs):
+            await release.wait()
+            return httpx.Response(200, json={"contacts": []})
+        
+        with patch("httpx.AsyncClient") as mock_async_client:
+            mock_client = mock_async_client.return_value
+            mock_client.request = AsyncMock(side_effect=slow_request)
+            
+            with patch("zoho_mcp.tools.api._get_access_token", return_value="test_token"):
+                readers = [
+                    asyncio.create_task(zoho_api_request_async("GET", "/contacts", params={"page": 1}))
+                    for _ in range(3)
+                ]
+                await asyncio.sleep(0.01)
+                release.set()
+                
+                assert await asyncio.gather(*readers) == [{"contacts": []}] * 3
+                assert mock_client.request.call_count == 1
 
 
 class TestRateLimiting:
@@ -133,7 +168,6 @@ class TestRateLimiting:
         """Reset rate limit state before each test."""
         api_module._rate_limit_retry_after = None
     
-    @pytest.mark.asyncio
     async def test_handle_rate_limit_with_retry_after_header(self):
         """Test rate limit handling with Retry-After header."""
         # Mock response with Retry-After header in seconds
@@ -149,7 +183,6 @@ class TestRateLimiting:
         assert api_module._rate_limit_retry_after is not None
         assert api_module._rate_limit_retry_after > datetime.now()
     
-    @pytest.mark.asyncio
     async def test_handle_rate_limit_with_exponential_backoff(self):
         """Test rate limit handling with exponential backoff."""
         # Mock response without Retry-After header
@@ -168,6 +201,23 @@ class TestRateLimiting:
         expected_2 = INITIAL_BACKOFF * (BACKOFF_MULTIPLIER ** 2)
         assert expected_2 * 0.75 <= wait_time_2 <= expected_2 * 1.25
     
+    async def test_handle_rate_limit_with_http_date(self):
+        """Test rate limit handling with an HTTP-date Retry-After header."""
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=10)
+        mock_response = MagicMock()
+        mock_response.headers = {"Retry-After": format_datetime(retry_at, usegmt=True)}
+        
+        wait_time = await _handle_rate_limit_async(mock_response, 0)
+        
+        assert 8 < wait_time <= 10
+    
+    async def test_handle_rate_limit_caps_retry_after(self):
+        """Test that a long Retry-After is capped."""
+        mock_response = MagicMock()
+        mock_response.headers = {"Retry-After": "3600"}
+        
+        assert await _handle_rate_limit_async(mock_response, 0) == MAX_RETRY_AFTER
+    
     def test_check_global_rate_limit(self):
         """Test global rate limit checking."""
         # No rate limit set
@@ -184,7 +234,6 @@ class TestRateLimiting:
         assert _check_global_rate_limit() is None
         assert api_module._rate_limit_retry_after is None  # Should be cleared
     
-    @pytest.mark.asyncio
     async def test_rate_limit_retry_in_api_request(self):
         """Test that rate limiting retry works in the API request function."""
         # Mock responses
@@ -192,16 +241,14 @@ class TestRateLimiting:
         rate_limit_response.status_code = 429
         rate_limit_response.headers = {"Retry-After": "0.1"}  # Short retry for testing
         
-        success_response = MagicMock()
-        success_response.status_code = 200
-        success_response.json.return_value = {"success": True}
+        success_response = httpx.Response(200, json={"success": True})
         
         # Mock client that returns 429 first, then 200
-        mock_client = AsyncMock()
+        mock_client = MagicMock()
         mock_client.request = AsyncMock(side_effect=[rate_limit_response, success_response])
         
         with patch("httpx.AsyncClient") as mock_async_client:
-            mock_async_client.return_value.__aenter__.return_value = mock_client
+            mock_async_client.return_value = mock_client
             
             with patch("zoho_mcp.tools.api._get_access_token", return_value="test_token"):
                 # Should retry and succeed
@@ -209,21 +256,21 @@ class TestRateLimiting:
                 assert result == {"success": True}
                 assert mock_client.request.call_count == 2
     
-    @pytest.mark.asyncio
     async def test_rate_limit_max_retries_exceeded(self):
         """Test that rate limiting gives up after max retries."""
         # Mock response that always returns 429
-        rate_limit_response = MagicMock()
-        rate_limit_response.status_code = 429
-        rate_limit_response.headers = {"Retry-After": "0.01"}  # Very short for testing
-        rate_limit_response.json.return_value = {"message": "Rate limit exceeded"}
+        rate_limit_response = httpx.Response(
+            429,
+            headers={"Retry-After": "0.01"},  # Very short for testing
+            json={"message": "Rate limit exceeded"},
+        )
         
         # Mock client that always returns 429
-        mock_client = AsyncMock()
+        mock_client = MagicMock()
         mock_client.request = AsyncMock(return_value=rate_limit_response)
         
         with patch("httpx.AsyncClient") as mock_async_client:
-            mock_async_client.return_value.__aenter__.return_value = mock_client
+            mock_async_client.return_value = mock_client
             
             with patch("zoho_mcp.tools.api._get_access_token", return_value="test_token"):
                 # Should raise exception after max retries
@@ -233,25 +280,388 @@ class TestRateLimiting:
                 # Should have tried MAX_RETRIES times
                 assert mock_client.request.call_count == MAX_RETRIES
     
-    @pytest.mark.asyncio
+    async def test_server_error_retry_for_get(self):
+        """Test that 5xx responses to GET requests are retried."""
+        error_response = MagicMock(status_code=503)
+        success_response = httpx.Response(200, json={"success": True})
+        
+        mock_client = MagicMock(is_closed=False)
+        mock_client.request = AsyncMock(side_effect=[error_response, success_response])
+        
+        with patch("httpx.AsyncClient", return_value=mock_client):
+            with patch("zoho_mcp.tools.api._get_access_token", return_value="test_token"):
+                with patch("zoho_mcp.tools.api.asyncio.sleep", new=AsyncMock()):
+                    result = await zoho_api_request_async("GET", "/invoices/retry")
+        
+        assert result == {"success": True}
+        assert mock_client.request.call_count == 2
+    
+    async def test_server_error_not_retried_for_post(self):
+        """Test that 5xx responses to POST requests are not retried."""
+        error_response = httpx.Response(500, json={"message": "Internal error"})
+        
+        mock_client = MagicMock(is_closed=False)
+        mock_client.request = AsyncMock(return_value=error_response)
+        
+        with patch("httpx.AsyncClient", return_value=mock_client):
+            with patch("zoho_mcp.tools.api._get_access_token", return_value="test_token"):
+                with pytest.raises(Exception):
+                    await zoho_api_request_async("POST", "/invoices", json_data={"test": "data"})
+        
+        assert mock_client.request.call_count == 1
+    
+    def test_rate_limit_retry_in_sync_request(self):
+        """Test that the sync request function also retries after a 429."""
+        rate_limit_response = MagicMock(status_code=429)
+        rate_limit_response.headers = {"Retry-After": "0.1"}
+        success_response = httpx.Response(200, json={"success": True})
+        
+        mock_client = MagicMock(is_closed=False)
+        mock_client.request = AsyncMock(side_effect=[rate_limit_response, success_response])
+        
+        with patch("httpx.AsyncClient", return_value=mock_client):
+            with patch("zoho_mcp.tools.api._get_access_token", return_value="test_token"):
+                with patch("zoho_mcp.tools.api.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+                    result = zoho_api_request("POST", "/invoices", json={"test": "data"})
+        
+        assert result == {"success": True}
+        assert mock_client.request.call_count == 2
+        mock_sleep.assert_awaited_once_with(0.1)
+    
+    async def test_unauthorized_refreshes_token_and_resends(self):
+        """Test that a 401 refreshes the token and resends with the new one."""
+        unauthorized_response = httpx.Response(401, json={"message": "Invalid token"})
+        success_response = httpx.Response(200, json={"success": True})
+        
+        mock_client = MagicMock(is_closed=False)
+        mock_client.request = AsyncMock(side_effect=[unauthorized_response, success_response])
+        
+        with patch("httpx.AsyncClient", return_value=mock_client):
+            with patch("zoho_mcp.tools.api._get_access_token", side_effect=["old_token", "new_token"]):
+                result = await zoho_api_request_async("POST", "/invoices", json_data={"test": "data"})
+        
+        assert result == {"success": True}
+        sent_tokens = [call.kwargs["headers"]["Authorization"] for call in mock_client.request.call_args_list]
+        assert sent_tokens == ["Zoho-oauthtoken old_token", "Zoho-oauthtoken new_token"]
+    
+    async def test_unauthorized_twice_raises(self):
+        """Test that a second 401 after refreshing is raised."""
+        unauthorized_response = httpx.Response(401, json={"message": "Invalid token"})
+        
+        mock_client = MagicMock(is_closed=False)
+        mock_client.request = AsyncMock(return_value=unauthorized_response)
+        
+        with patch("httpx.AsyncClient", return_value=mock_client):
+            with patch("zoho_mcp.tools.api._get_access_token", return_value="test_token"):
+                with pytest.raises(ZohoAuthenticationError):
+                    await zoho_api_request_async("POST", "/invoices", json_data={"test": "data"})
+        
+        assert mock_client.request.call_count == 2
+    
     async def test_network_error_retry(self):
         """Test that network errors are retried with exponential backoff."""
         # Mock successful response for final attempt
-        success_response = MagicMock()
-        success_response.status_code = 200
-        success_response.json.return_value = {"success": True}
+        success_response = httpx.Response(200, json={"success": True})
         
         # Mock client that raises network error first, then succeeds
-        mock_client = AsyncMock()
+        mock_client = MagicMock()
         mock_client.request = AsyncMock(
             side_effect=[httpx.RequestError("Network error"), success_response]
         )
         
         with patch("httpx.AsyncClient") as mock_async_client:
-            mock_async_client.return_value.__aenter__.return_value = mock_client
+            mock_async_client.return_value = mock_client
             
             with patch("zoho_mcp.tools.api._get_access_token", return_value="test_token"):
                 # Should retry and succeed
                 result = await zoho_api_request_async("GET", "/invoices")
                 assert result == {"success": True}
-                assert mock_client.request.call_count == 2
\ No newline at end of file
+                assert mock_client.request.call_count == 2
+
+
+class TestConnectionPool:
+    """Test suite for the shared HTTP clients."""
+    
+    async def test_client_is_reused(self):
+        """Test that consecutive requests share one client."""
+        client = _get_async_client()
+        try:
+            assert _get_async_client() is client
+        finally:
+            await client.aclose()
+    
+    async def test_closed_client_is_replaced(self):
+        """Test that a closed client is replaced by a new one."""
+        client = _get_async_client()
+        await client.aclose()
+        
+        replacement = _get_async_client()
+        try:
+            assert replacement is not client
+            assert not replacement.is_closed
+        finally:
+            await replacement.aclose()
+    
+    async def test_requests_share_the_client(self):
+        """Test that the API request function builds the client only once."""
+        success_response = httpx.Response(200, json={"success": True})
+        
+        mock_client = MagicMock(is_closed=False)
+        mock_client.request = AsyncMock(return_value=success_response)
+        
+        with patch("httpx.AsyncClient", return_value=mock_client) as mock_async_client:
+            with patch("zoho_mcp.tools.api._get_access_token", return_value="test_token"):
+                await zoho_api_request_async("POST", "/invoices", json_data={"n": 1})
+                await zoho_api_request_async("POST", "/invoices", json_data={"n": 2})
+        
+        assert mock_async_client.call_count == 1
+        assert mock_client.request.call_count == 2
+    
+    async def test_http2_follows_h2_availability(self, monkeypatch):
+        """Test that HTTP/2 is only requested when the h2 package is installed."""
+        monkeypatch.setattr(api_module, "HTTP2_ENABLED", False)
+        
+        with patch("httpx.AsyncClient") as mock_async_client:
+            _get_async_client()
+        
+        assert mock_async_client.call_args.kwargs["http2"] is False
+        
+        with patch("httpx.Client") as mock_client:
+            api_module._get_auth_client()
+        
+        assert mock_client.call_args.kwargs["http2"] is False
+    
+    async def test_client_sends_organization_id_by_default(self, monkeypatch):
+        """Test that the client resolves endpoints and adds the organization ID."""
+        monkeypatch.setattr(api_module, "ORG_ID", "org123")
+        
+        client = api_module._new_async_client()
+        try:
+            request = client.build_request("GET", "/invoices", params={"page": 2})
+            override = client.build_request("GET", "/invoices", params={"organization_id": "other"})
+        finally:
+            await client.aclose()
+        
+        assert str(request.url).startswith(f"{api_module.API_BASE_URL}/invoices?")
+        assert request.url.params["organization_id"] == "org123"
+        assert request.url.params["page"] == "2"
+        assert override.url.params["organization_id"] == "other"
+    
+    def test_sync_requests_share_a_client(self):
+        """Test that sync requests run on one background loop with one client."""
+        success_response = httpx.Response(200, json={"success": True})
+        
+        mock_client = MagicMock(is_closed=False)
+        mock_client.request = AsyncMock(return_value=success_response)
+        
+        with patch("httpx.AsyncClient", return_value=mock_client) as mock_async_client:
+            with patch("zoho_mcp.tools.api._get_access_token", return_value="test_token"):
+                zoho_api_request("POST", "/invoices", json={"n": 1})
+                zoho_api_request("POST", "/invoices", json={"n": 2})
+        
+        assert mock_async_client.call_count == 1
+        assert mock_client.request.call_count == 2
+        assert api_module._sync_client is mock_client
+    
+    async def test_sync_request_inside_running_loop(self):
+        """Test that the sync request function also works while a loop is running."""
+        success_response = httpx.Response(200, json={"success": True})
+        
+        mock_client = MagicMock(is_closed=False)
+        mock_client.request = AsyncMock(return_value=success_response)
+        
+        with patch("httpx.AsyncClient", return_value=mock_client):
+            with patch("zoho_mcp.tools.api._get_access_token", return_value="test_token"):
+                assert zoho_api_request("POST", "/invoices", json={"n": 1}) == {"success": True}
+    
+    def test_sync_request_on_background_loop_raises(self):
+        """Test that a sync request from the background loop fails instead of hanging."""
+        async def call_sync():
+            zoho_api_request("GET", "/invoices")
+        
+        future = asyncio.run_coroutine_threadsafe(call_sync(), api_module._get_sync_loop())
+        
+        with pytest.raises(RuntimeError, match="zoho_api_request_async"):
+            future.result(timeout=5)
+    
+    def test_auth_client_is_reused(self):
+        """Test that token refreshes share one client."""
+        client = api_module._get_auth_client()
+        try:
+            assert api_module._get_auth_client() is client
+        finally:
+            client.close()
+    
+    def test_close_clients(self):
+        """Test that closing the clients stops the background loop."""
+        loop = api_module._get_sync_loop()
+        close_clients()
+        
+        assert loop.is_closed()
+        assert api_module._sync_loop is None
+        assert api_module._sync_client is None
+        assert api_module._async_client is None
+        assert api_module._auth_client is None
+
+
+class TestTokenRefresh:
+    """Test suite for deduplicated token refreshes."""
+    
+    async def test_concurrent_async_refreshes_share_one_request(self):
+        """Test that coroutines refreshing at once await a single refresh."""
+        calls = []
+        
+        def refresh(force_refresh=False):
+            calls.append(force_refresh)
+            time.sleep(0.05)
+            return "new_token"
+        
+        with patch("zoho_mcp.tools.api._get_access_token", side_effect=refresh):
+            tokens = await asyncio.gather(
+                *(_get_access_token_async(force_refresh=True) for _ in range(5))
+            )
+        
+        assert tokens == ["new_token"] * 5
+        assert calls == [True]
+        assert api_module._refresh_future is None
+    
+    async def test_async_uses_cached_token(self):
+        """Test that a valid cached token is returned without refreshing."""
+        cached = {"access_token": "cached_token", "expires_at": time.time() + 3600}
+        
+        with patch("zoho_mcp.tools.api._load_token_from_cache", return_value=cached):
+            with patch("zoho_mcp.tools.api._get_access_token") as mock_get_token:
+                assert await _get_access_token_async() == "cached_token"
+        
+        mock_get_token.assert_not_called()
+    
+    def test_concurrent_sync_refreshes_share_one_request(self):
+        """Test that threads waiting on a refresh reuse its token."""
+        refreshed = {"access_token": "new_token", "expires_at": time.time() + 3600}
+        barrier = threading.Barrier(5)
+        tokens = []
+        
+        def refresh():
+            time.sleep(0.05)
+            return "new_token"
+        
+        def worker():
+            barrier.wait()
+            tokens.append(_get_access_token(force_refresh=True))
+        
+        with patch("zoho_mcp.tools.api._load_token_from_cache", return_value=refreshed):
+            with patch("zoho_mcp.tools.api._refresh_access_token", side_effect=refresh) as mock_refresh:
+                threads = [threading.Thread(target=worker) for _ in range(5)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+        
+        assert tokens == ["new_token"] * 5
+        assert mock_refresh.call_count == 1
+    
+    def test_valid_token_skips_file_read(self):
+        """Test that a token held in memory is used without reading the cache file."""
+        cached = {"access_token": "cached_token", "expires_at": time.time() + 3600}
+        
+        with patch("zoho_mcp.tools.api._load_token_from_cache", return_value=cached) as mock_load:
+            assert _get_access_token() == "cached_token"
+            assert _get_access_token() == "cached_token"
+        
+        assert mock_load.call_count == 1
+    
+    def test_saved_token_is_kept_in_memory(self, tmp_path, monkeypatch):
+        """Test that saving a token also updates the in-memory copy."""
+        monkeypatch.setattr(api_module, "TOKEN_CACHE_FILE", tmp_path / "token.json")
+        token_data = {"access_token": "new_token", "expires_at": time.time() + 3600}
+        
+        _save_token_to_cache(token_data)
+        
+        with patch("zoho_mcp.tools.api._load_token_from_cache") as mock_load:
+            assert _get_access_token() == "new_token"
+        mock_load.assert_not_called()
+    
+    def test_token_near_expiry_is_refreshed(self):
+        """Test that a token inside the expiry buffer is refreshed rather than used."""
+        expiring = {
+            "access_token": "expiring_token",
+            "expires_at": time.time() + api_module.TOKEN_EXPIRY_BUFFER_SECONDS - 30,
+        }
+        
+        with patch("zoho_mcp.tools.api._load_token_from_cache", return_value=expiring):
+            with patch("zoho_mcp.tools.api._refresh_access_token", return_value="new_token"):
+                assert _get_access_token() == "new_token"
+    
+    def test_expiry_uses_monotonic_clock(self):
+        """Test that a wall-clock jump doesn't change whether the token is fresh."""
+        cached = {"access_token": "cached_token", "expires_at": time.time() + 3600}
+        
+        with patch("zoho_mcp.tools.api._load_token_from_cache", return_value=cached):
+            assert _get_access_token() == "cached_token"
+        
+        with patch("zoho_mcp.tools.api.time.time", return_value=time.time() + 7200):
+            with patch("zoho_mcp.tools.api._refresh_access_token") as mock_refresh:
+                assert _get_access_token() == "cached_token"
+        mock_refresh.assert_not_called()
+    
+    def test_save_replaces_cache_file_atomically(self, tmp_path, monkeypatch):
+        """Test that saving leaves only the complete cache file behind."""
+        cache_file = tmp_path / "token.json"
+        cache_file.write_text('{"access_token": "old_token"}')
+        monkeypatch.setattr(api_module, "TOKEN_CACHE_FILE", cache_file)
+        token_data = {"access_token": "new_token", "expires_at": time.time() + 3600}
+        
+        _save_token_to_cache(token_data)
+        
+        assert _json_loads(cache_file.read_bytes()) == token_data
+        assert [path.name for path in tmp_path.iterdir()] == ["token.json"]
+    
+    def test_failed_save_removes_temporary_file(self, tmp_path, monkeypatch):
+        """Test that a failed rename doesn't leave the temporary file behind."""
+        cache_file = tmp_path / "token.json"
+        cache_file.write_text('{"access_token": "old_token"}')
+        monkeypatch.setattr(api_module, "TOKEN_CACHE_FILE", cache_file)
+        
+        with patch("zoho_mcp.tools.api.os.replace", side_effect=PermissionError("denied")):
+            _save_token_to_cache({"access_token": "new_token", "expires_at": time.time() + 3600})
+        
+        assert [path.name for path in tmp_path.iterdir()] == ["token.json"]
+        assert _json_loads(cache_file.read_bytes()) == {"access_token": "old_token"}
+
+
+class TestJson:
+    """Test suite for the JSON helpers, with and without orjson."""
+    
+    @pytest.fixture(params=["orjson", "stdlib"])
+    def json_backend(self, request, monkeypatch):
+        """Run each test with orjson and with the stdlib fallback."""
+        if request.param == "stdlib":
+            monkeypatch.setattr(api_module, "orjson", None)
+        return request.param
+    
+    def test_round_trip(self, json_backend):
+        """Test that dumped values load back unchanged."""
+        value = {"access_token": "token", "expires_at": 1700000000.5}
+        
+        dumped = _json_dumps(value)
+        
+        assert isinstance(dumped, bytes)
+        assert _json_loads(dumped) == value
+    
+    def test_invalid_json_raises_value_error(self, json_backend):
+        """Test that invalid documents raise a ValueError subclass."""
+        with pytest.raises(ValueError):
+            _json_loads(b"not json")
+    
+    async def test_request_body_is_encoded_once(self, json_backend):
+        """Test that JSON bodies are sent as pre-encoded bytes with the JSON content type."""
+        with patch("zoho_mcp.tools.api._get_access_token", return_value="test_token"):
+            with patch("httpx.AsyncClient") as mock_client_cls:
+                mock_client = mock_client_cls.return_value
+                mock_client.request = AsyncMock(return_value=httpx.Response(201, json={"code": 0}))
+                
+                await zoho_api_request_async("POST", "/contacts", json_data={"contact_name": "Acme"})
+                
+                call_kwargs = mock_client.request.call_args.kwargs
+                assert _json_loads(call_kwargs["content"]) == {"contact_name": "Acme"}
+                assert call_kwargs["headers"]["Content-Type"] == "application/json"
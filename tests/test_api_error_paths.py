@@ -0,0 +1,109 @@
+"""
+Tests that expense, item and sales order tools propagate errors raised by the API client.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from tests.payloads import MOCK_EXPENSE_ID, SAMPLE_ITEM_RESPONSE
+from zoho_mcp.tools import expenses, items, sales
+from zoho_mcp.tools.api import ZohoAPIError, ZohoRequestError
+
+
+ERROR_CASES = [
+    # (tool module, tool function, kwargs, responses before the failure, exception)
+    (expenses, expenses.list_expenses, {}, [], Exception("API error")),
+    (
+        expenses,
+        expenses.create_expense,
+        {
+            "account_id": "account123",
+            "date": "2025-01-15",
+            "amount": 500.50,
+            "paid_through_account_id": "paid_account123",
+        },
+        [],
+        Exception("API error"),
+    ),
+    (expenses, expenses.get_expense, {"expense_id": MOCK_EXPENSE_ID}, [], Exception("API error")),
+    (
+        expenses,
+        expenses.update_expense,
+        {"expense_id": MOCK_EXPENSE_ID, "amount": 600.75},
+        [],
+        Exception("API error"),
+    ),
+    (items, items.list_items, {}, [], ZohoRequestError(400, "Invalid request")),
+    (
+        items,
+        items.create_item,
+        {"name": "Test Item", "rate": 100.0},
+        [],
+        ZohoRequestError(400, "Invalid request"),
+    ),
+    (
+        items,
+        items.get_item,
+        {"item_id": "123456789"},
+        [],
+        ZohoRequestError(404, "Item not found"),
+    ),
+    # update_item fetches the current item first, so the PUT is the second call
+    (
+        items,
+        items.update_item,
+        {"item_id": "123456789", "name": "New Name"},
+        [SAMPLE_ITEM_RESPONSE],
+        ZohoRequestError(400, "Invalid request"),
+    ),
+    (sales, sales.list_sales_orders, {}, [], ZohoAPIError(400, "Invalid request")),
+    (
+        sales,
+        sales.create_sales_order,
+        {
+            "customer_id": "67890",
+            "line_items": [{"item_id": "item1", "rate": 100.00, "quantity": 2}],
+        },
+        [],
+        ZohoAPIError(400, "Invalid request"),
+    ),
+    (
+        sales,
+        sales.get_sales_order,
+        {"salesorder_id": "12345"},
+        [],
+        ZohoAPIError(404, "Sales order not found"),
+    ),
+    (
+        sales,
+        sales.update_sales_order,
+        {"salesorder_id": "12345", "notes": "Updated notes"},
+        [],
+        ZohoAPIError(404, "Sales order not found"),
+    ),
+    (
+        sales,
+        sales.convert_to_invoice,
+        {"salesorder_id": "12345"},
+        [],
+        ZohoAPIError(400, "Invalid request"),
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "module, tool, kwargs, responses, error",
+    ERROR_CASES,
+    ids=[case[1].__name__ for case in ERROR_CASES],
+)
+async def test_tool_propagates_api_error(module, tool, kwargs, responses, error):
+    """Test that an API client error surfaces unchanged from the tool."""
+    mock_api = AsyncMock(side_effect=[*responses, error])
+
+    with patch.object(module, "zoho_api_request_async", mock_api):
+        with pytest.raises(type(error)) as context:
+            await tool(**kwargs)
+
+    assert context.value is error
+    assert mock_api.await_count == len(responses) + 1
@@ -2,20 +2,21 @@
 Test suite for bulk operations functionality.
 """
 
-import pytest
+import asyncio
 from unittest.mock import patch
 
 from zoho_mcp.bulk_operations import (
+    bulk_create_customers,
     bulk_create_invoices,
     bulk_record_expenses,
     batch_process_with_progress,
+    MAX_CONCURRENT_CREATES,
 )
 
 
 class TestBulkInvoiceOperations:
     """Test suite for bulk invoice operations."""
     
-    @pytest.mark.asyncio
     async def test_bulk_create_invoices_success(self):
         """Test successful bulk invoice creation."""
         # Mock the create_invoice function
@@ -92,7 +93,6 @@ class TestBulkInvoiceOperations:
             assert "BULK-" in call_args[0][1]["reference_number"]
             assert call_args[2][1]["reference_number"] == "CUSTOM-REF"
     
-    @pytest.mark.asyncio
     async def test_bulk_create_invoices_with_failures(self):
         """Test bulk invoice creation with some failures."""
         # Mock create_invoice to fail on second call
@@ -138,7 +138,6 @@ class TestBulkInvoiceOperations:
             assert result["failed_invoices"][0]["customer_id"] == "INVALID"
             assert "API Error" in result["failed_invoices"][0]["error"]
     
-    @pytest.mark.asyncio
     async def test_bulk_create_invoices_with_callback(self):
         """Test bulk invoice creation with progress callback."""
         callback_calls = []
@@ -169,10 +168,57 @@ class TestBulkInvoiceOperations:
             assert callback_calls[1] == (2, 2)
 
 
+class TestBulkCustomerOperations:
+    """Test suite for bulk customer operations."""
+    
+    async def test_bulk_create_customers_with_failures(self):
+        """Test that bulk customer creation reports results in input order."""
+        with patch("zoho_mcp.bulk_operations.create_customer") as mock_create:
+            mock_create.side_effect = [
+                {"contact": {"contact_id": "C-1", "contact_name": "Customer 1"}},
+                ValueError("Invalid customer data: email"),
+                {"contact": {"contact_id": "C-3", "contact_name": "Customer 3"}},
+            ]
+            
+            customers_data = [
+                {"contact_name": "Customer 1", "email": "one@example.com"},
+                {"contact_name": "Customer 2"},
+                {"contact_name": "Customer 3", "email": "three@example.com"},
+            ]
+            
+            result = await bulk_create_customers(customers_data)
+            
+            assert result["summary"] == {"total_requested": 3, "successful": 2, "failed": 1}
+            assert [c["contact_id"] for c in result["successful_customers"]] == ["C-1", "C-3"]
+            assert result["failed_customers"][0]["index"] == 1
+            assert result["failed_customers"][0]["contact_name"] == "Customer 2"
+            assert mock_create.await_count == 3
+    
+    async def test_bulk_create_customers_limits_concurrency(self):
+        """Test that no more than MAX_CONCURRENT_CREATES requests run at once."""
+        in_flight = 0
+        peak = 0
+        
+        async def create(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"contact": {"contact_id": kwargs["contact_name"]}}
+        
+        with patch("zoho_mcp.bulk_operations.create_customer", side_effect=create):
+            result = await bulk_create_customers(
+                [{"contact_name": f"C-{i}"} for i in range(MAX_CONCURRENT_CREATES * 2)]
+            )
+        
+        assert result["summary"]["successful"] == MAX_CONCURRENT_CREATES * 2
+        assert peak == MAX_CONCURRENT_CREATES
+
+
 class TestBulkExpenseOperations:
     """Test suite for bulk expense operations."""
     
-    @pytest.mark.asyncio
     async def test_bulk_record_expenses_success(self):
         """Test successful bulk expense recording."""
         with patch("zoho_mcp.bulk_operations.create_expense") as mock_create:
@@ -224,7 +270,6 @@ class TestBulkExpenseOperations:
             assert result["successful_expenses"][0]["expense_id"] == "EXP-001"
             assert result["successful_expenses"][1]["account_name"] == "Travel"
     
-    @pytest.mark.asyncio
     async def test_bulk_record_expenses_with_failures(self):
         """Test bulk expense recording with failures."""
         with patch("zoho_mcp.bulk_operations.create_expense") as mock_create:
@@ -257,7 +302,6 @@ class TestBulkExpenseOperations:
 class TestBatchProcessing:
     """Test suite for batch processing functionality."""
     
-    @pytest.mark.asyncio
     async def test_batch_process_with_progress(self):
         """Test batch processing with progress tracking."""
         # Mock processing function
@@ -285,7 +329,6 @@ class TestBatchProcessing:
         assert results[1]["batch_data"] == list(range(10, 20))
         assert results[2]["batch_data"] == list(range(20, 25))
     
-    @pytest.mark.asyncio
     async def test_batch_process_with_error(self):
         """Test batch processing with errors in some batches."""
         async def mock_process_batch(batch):
@@ -313,7 +356,6 @@ class TestBatchProcessing:
         assert results[1]["error"] == "Batch processing error"
         assert results[1]["batch_index"] == 1
     
-    @pytest.mark.asyncio
     async def test_batch_process_with_callback(self):
         """Test batch processing with progress callback."""
         callback_calls = []
@@ -322,6 +322,8 @@ class TestContextManagers(unittest.TestCase):
     def test_log_api_call(self, mock_error, mock_debug, mock_info):
         """Test the log_api_call context manager."""
         logger = logging.getLogger("test")
+        logger.setLevel(logging.DEBUG)
+        self.addCleanup(logger.setLevel, logging.NOTSET)
         
         # Test successful API call
         with log_api_call("GET", "/test", logger) as context:
@@ -352,6 +354,21 @@ class TestContextManagers(unittest.TestCase):
         mock_info.assert_called_once_with("API Request: POST /error")
         mock_error.assert_called_once()
     
+    @patch('logging.Logger.debug')
+    def test_log_api_call_skips_body_without_debug(self, mock_debug):
+        """Test that the response body isn't serialised when debug logging is off."""
+        logger = logging.getLogger("test")
+        logger.setLevel(logging.INFO)
+        self.addCleanup(logger.setLevel, logging.NOTSET)
+        
+        with patch('zoho_mcp.logging.sanitize_request_data') as mock_sanitize:
+            with log_api_call("GET", "/test", logger) as context:
+                context["status_code"] = 200
+                context["response_body"] = {"result": "success"}
+        
+        mock_sanitize.assert_not_called()
+        mock_debug.assert_not_called()
+    
     @patch('logging.Logger.info')
     @patch('logging.Logger.debug')
     @patch('logging.Logger.error')
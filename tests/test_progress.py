@@ -2,7 +2,6 @@
 Test suite for progress tracking functionality.
 """
 
-import pytest
 import asyncio
 from unittest.mock import MagicMock, patch
 from datetime import datetime, timedelta
@@ -89,7 +88,6 @@ class TestProgressTracker:
         assert callback_calls[0] == (3, 10)
         assert callback_calls[1] == (6, 10)
     
-    @pytest.mark.asyncio
     async def test_async_increment(self):
         """Test async increment functionality."""
         tracker = ProgressTracker(10, "Test async", notify_interval=5)
@@ -155,7 +153,6 @@ class TestBulkOperationProgress:
             tracker.increment(5)
             assert tracker.current == 5
     
-    @pytest.mark.asyncio
     async def test_async_context_manager(self):
         """Test BulkOperationProgress as async context manager."""
         async with BulkOperationProgress(20, "Test async bulk") as tracker:
@@ -219,7 +216,6 @@ class TestCreateProgressTracker:
 class TestBulkOperations:
     """Test suite for bulk operations with progress tracking."""
     
-    @pytest.mark.asyncio
     async def test_bulk_create_invoices(self):
         """Test bulk invoice creation with progress tracking."""
         # Mock the create_invoice function
@@ -251,7 +247,6 @@ class TestBulkOperations:
             assert len(result["successful_invoices"]) == 2
             assert len(result["failed_invoices"]) == 0
     
-    @pytest.mark.asyncio
     async def test_bulk_create_invoices_with_failures(self):
         """Test bulk invoice creation with some failures."""
         # Mock the create_invoice function to fail on second call
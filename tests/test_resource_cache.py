@@ -0,0 +1,139 @@
+"""
+Test suite for the resource content cache.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from zoho_mcp import resource_cache
+from zoho_mcp.resource_cache import cached, cached_resource
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start and finish every test with an empty cache."""
+    resource_cache.clear()
+    yield
+    resource_cache.clear()
+
+
+class TestCached:
+    """Test suite for the cached helper."""
+
+    async def test_reuses_fresh_content(self):
+        """Test that a fresh entry is returned without computing again."""
+        compute = AsyncMock(return_value="content")
+
+        assert await cached("test://uri", 60, compute) == "content"
+        assert await cached("test://uri", 60, compute) == "content"
+
+        compute.assert_awaited_once()
+
+    async def test_recomputes_expired_content(self):
+        """Test that an expired entry is computed again."""
+        compute = AsyncMock(side_effect=["first", "second"])
+
+        with patch("zoho_mcp.resource_cache.time") as mock_time:
+            mock_time.monotonic.side_effect = [0.0, 61.0, 61.0]
+            assert await cached("test://uri", 60, compute) == "first"
+            assert await cached("test://uri", 60, compute) == "second"
+
+        assert compute.await_count == 2
+
+    async def test_keys_are_independent(self):
+        """Test that each key caches its own content."""
+        compute_a = AsyncMock(return_value="a")
+        compute_b = AsyncMock(return_value="b")
+
+        assert await cached("test://a", 60, compute_a) == "a"
+        assert await cached("test://b", 60, compute_b) == "b"
+
+    async def test_errors_are_not_cached(self):
+        """Test that a failed compute leaves nothing behind."""
+        compute = AsyncMock(side_effect=[RuntimeError("API down"), "content"])
+
+        with pytest.raises(RuntimeError):
+            await cached("test://uri", 60, compute)
+        assert await cached("test://uri", 60, compute) == "content"
+
+    async def test_concurrent_misses_share_one_compute(self):
+        """Test that callers missing at the same time await a single compute."""
+        release = asyncio.Event()
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await release.wait()
+            return "content"
+
+        readers = [asyncio.create_task(cached("test://uri", 60, compute)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*readers) == ["content"] * 3
+        assert len(calls) == 1
+
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        """Test that cancelling one waiter leaves the shared compute running."""
+        release = asyncio.Event()
+
+        async def compute():
+            await release.wait()
+            return "content"
+
+        first = asyncio.create_task(cached("test://uri", 60, compute))
+        second = asyncio.create_task(cached("test://uri", 60, compute))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == "content"
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    async def test_render_from_another_loop_is_not_joined(self):
+        """Test that a pending render left by another event loop is replaced."""
+        other_loop = asyncio.new_event_loop()
+        try:
+            stale = other_loop.create_future()
+            resource_cache._pending["test://uri"] = stale
+            compute = AsyncMock(return_value="content")
+
+            assert await cached("test://uri", 60, compute) == "content"
+
+            compute.assert_awaited_once()
+            assert not stale.done()
+        finally:
+            other_loop.close()
+
+    async def test_clear_drops_entries(self):
+        """Test that clear forces the next read to compute again."""
+        compute = AsyncMock(return_value="content")
+
+        await cached("test://uri", 60, compute)
+        resource_cache.clear()
+        await cached("test://uri", 60, compute)
+
+        assert compute.await_count == 2
+
+
+class TestCachedResource:
+    """Test suite for the cached_resource decorator."""
+
+    async def test_decorated_handler_is_cached(self):
+        """Test that the decorated handler only runs once while fresh."""
+        calls = []
+
+        @cached_resource("test://uri")
+        async def handler() -> str:
+            """Render the test resource."""
+            calls.append(1)
+            return "content"
+
+        assert await handler() == "content"
+        assert await handler() == "content"
+        assert len(calls) == 1
+        assert handler.__name__ == "handler"
+        assert handler.__doc__ == "Render the test resource."
@@ -2,24 +2,103 @@
 Test suite for Zoho Books MCP resources.
 """
 
+import asyncio
+
 import pytest
+from contextlib import ExitStack
 from unittest.mock import AsyncMock, patch, MagicMock
-from datetime import datetime
+from datetime import date, datetime, timedelta
+
+from zoho_mcp import resource_cache
+from zoho_mcp.resources import (
+    MAX_CONCURRENT_PAGES,
+    MAX_PAGE_SIZE,
+    _days_past_due,
+    register_resources,
+)
 
-from mcp.server.fastmcp import FastMCP
-from mcp.types import Resource, TextContent
 
-from zoho_mcp.resources import register_resources
+@pytest.fixture(autouse=True)
+def clear_resource_cache():
+    """Start every test with nothing cached, so each one sees its own mocks."""
+    resource_cache.clear()
+    yield
+    resource_cache.clear()
 
 
 @pytest.fixture
 def mock_mcp():
     """Create a mock FastMCP server instance."""
-    mcp = MagicMock(spec=FastMCP)
+    mcp = MagicMock()
     mcp.resource = MagicMock()
     return mcp
 
 
+def api_router(mapping):
+    """Build an API client side effect that answers by (method, path)."""
+    async def impl(method, path, **kwargs):
+        return mapping[(method, path)]
+    return impl
+
+
+RESOURCE_CASES = [
+    # (resource URI, name patched in zoho_mcp.resources, AsyncMock kwargs, expected text)
+    (
+        "dashboard://summary",
+        "zoho_api_request_async",
+        {
+            "side_effect": api_router({
+                ("GET", "/organizations"): {
+                    "organizations": [{"name": "Test Org", "organization_id": "123"}],
+                },
+                ("GET", "/dashboard"): {
+                    "dashboard": {"total_revenue": 3000, "overdue_invoices_count": 5},
+                },
+            }),
+        },
+        (
+            "**Organization**: Test Org",
+            "Total Income: 3,000.00",
+            "Number of Overdue Invoices: 5",
+        ),
+    ),
+    (
+        "invoice://overdue",
+        "list_invoices",
+        {
+            "return_value": {
+                "invoices": [
+                    {
+                        "invoice_number": "INV-001",
+                        "customer_name": "Test Customer",
+                        "balance": 500.00,
+                        "due_date": "2023-01-01",
+                    }
+                ]
+            },
+        },
+        ("Invoice #INV-001", "Test Customer", "500.00"),
+    ),
+]
+
+
+@pytest.fixture(scope="module")
+def resource_funcs():
+    """Register the resources once and map each URI to its handler."""
+    funcs = {}
+    
+    def capture(uri, **kwargs):
+        def decorator(func):
+            funcs[uri] = func
+            return func
+        return decorator
+    
+    mcp = MagicMock()
+    mcp.resource = capture
+    register_resources(mcp)
+    return funcs
+
+
 @pytest.fixture
 def mock_api_request():
     """Create a mock for zoho_api_request_async."""
@@ -27,65 +106,42 @@ def mock_api_request():
         yield mock
 
 
+# Canned return values for the tools zoho_mcp.resources calls, keyed by tool name
+TOOL_RESPONSES = {
+    "list_invoices": {
+        "invoices": [
+            {
+                "invoice_number": "INV-001",
+                "customer_name": "Test Customer",
+                "balance": 400.00,
+                "total": 1000.00,
+                "status": "overdue",
+                "due_date": "2023-01-01",
+            },
+        ],
+        "total": 1,
+        "has_more_page": False,
+    },
+}
+
+
+@pytest.fixture(scope="module")
+def patched_tools():
+    """Patch the tools used by resources once for the whole module."""
+    with ExitStack() as stack:
+        mocks = {}
+        for name, response in TOOL_RESPONSES.items():
+            mocks[name] = stack.enter_context(patch(f"zoho_mcp.resources.{name}"))
+            mocks[name].return_value = response
+        yield mocks
+
+
 @pytest.fixture
-def mock_tools():
-    """Create mocks for the tools used by resources."""
-    with patch("zoho_mcp.resources.list_contacts") as mock_contacts, \
-         patch("zoho_mcp.resources.get_contact") as mock_get_contact, \
-         patch("zoho_mcp.resources.list_invoices") as mock_invoices, \
-         patch("zoho_mcp.resources.list_expenses") as mock_expenses, \
-         patch("zoho_mcp.resources.list_items") as mock_items:
-        
-        # Configure return values
-        mock_contacts.return_value = {
-            "contacts": [
-                {"contact_name": "Test Customer", "contact_type": "customer", "email": "test@example.com"},
-            ],
-            "total": 1,
-            "has_more_page": False,
-        }
-        
-        mock_get_contact.return_value = {
-            "contact": {
-                "contact_name": "Test Customer",
-                "contact_type": "customer",
-                "email": "test@example.com",
-                "phone": "123-456-7890",
-                "status": "active",
-            }
-        }
-        
-        mock_invoices.return_value = {
-            "invoices": [
-                {"invoice_number": "INV-001", "customer_name": "Test Customer", "total": 1000.00},
-            ],
-            "total": 1,
-            "has_more_page": False,
-        }
-        
-        mock_expenses.return_value = {
-            "expenses": [
-                {"date": "2023-01-01", "description": "Office supplies", "total": 50.00},
-            ],
-            "total": 1,
-            "has_more_page": False,
-        }
-        
-        mock_items.return_value = {
-            "items": [
-                {"name": "Test Item", "rate": 100.00, "product_type": "service"},
-            ],
-            "total": 1,
-            "has_more_page": False,
-        }
-        
-        yield {
-            "list_contacts": mock_contacts,
-            "get_contact": mock_get_contact,
-            "list_invoices": mock_invoices,
-            "list_expenses": mock_expenses,
-            "list_items": mock_items,
-        }
+def mock_tools(patched_tools):
+    """Hand out the module's tool mocks with call history cleared."""
+    for mock in patched_tools.values():
+        mock.reset_mock()
+    return patched_tools
 
 
 class TestResources:
@@ -117,170 +173,123 @@ class TestResources:
         for uri in expected_uris:
             assert uri in registered_uris
     
-    @pytest.mark.asyncio
-    async def test_dashboard_summary_resource_direct(self, mock_api_request):
-        """Test the dashboard summary resource function directly."""
-        # Mock API responses
-        mock_api_request.side_effect = [
-            # Organizations response
-            {"organizations": [{"name": "Test Org", "organization_id": "123"}]},
-            # Overdue invoices response
-            {"page_context": {"total": 5}},
-            # Unpaid invoices response
-            {"page_context": {"total": 10}},
-            # Revenue response
-            {"invoices": [{"total": 1000}, {"total": 2000}]},
-        ]
-        
-        # Import and call the resource function directly
-        from zoho_mcp.resources import register_resources
-        mcp = MagicMock()
-        
-        # Capture the dashboard function when it's registered
-        dashboard_func = None
-        def capture_dashboard(uri):
-            def decorator(func):
-                nonlocal dashboard_func
-                if uri == "dashboard://summary":
-                    dashboard_func = func
-                return func
-            return decorator
-        
-        mcp.resource = capture_dashboard
-        register_resources(mcp)
-        
-        # Call the captured function
-        result = await dashboard_func()
-        
-        # Verify the result
-        assert isinstance(result, Resource)
-        assert result.uri == "dashboard://summary"
-        assert result.name == "Dashboard Summary"
-        assert len(result.contents) == 1
-        assert isinstance(result.contents[0], TextContent)
-        
-        # Check content includes key metrics
-        content = result.contents[0].text
-        assert "Overdue Invoices: 5" in content
-        assert "Unpaid Invoices: 10" in content
-        assert "Monthly Revenue: $3,000.00" in content
+    @pytest.mark.parametrize(
+        "uri, target, mock_kwargs, expected",
+        RESOURCE_CASES,
+        ids=[case[0] for case in RESOURCE_CASES],
+    )
+    async def test_resource_direct(self, resource_funcs, uri, target, mock_kwargs, expected):
+        """Test that a resource function renders the data it fetches."""
+        # Patch the data source the resource reads from and call it
+        with patch(f"zoho_mcp.resources.{target}", AsyncMock(**mock_kwargs)):
+            result = await resource_funcs[uri]()
+        
+        # Verify the rendered content
+        assert isinstance(result, str)
+        missing = [text for text in expected if text not in result]
+        assert not missing, missing
     
-    @pytest.mark.asyncio
-    async def test_overdue_invoices_resource_direct(self, mock_api_request):
-        """Test the overdue invoices resource function directly."""
-        # Mock API response
-        mock_api_request.return_value = {
-            "invoices": [
-                {
-                    "invoice_number": "INV-001",
-                    "customer_name": "Test Customer",
-                    "balance": 500.00,
-                    "due_date": "2023-01-01",
-                }
-            ]
+    @pytest.mark.parametrize(
+        "page_context",
+        [
+            {"total": 201},
+            {"has_more_page": True},
+        ],
+        ids=["total", "has_more_page"],
+    )
+    async def test_recent_payments_fetches_every_page(
+        self, resource_funcs, mock_api_request, page_context
+    ):
+        """Test that recent payments include records beyond the first page."""
+        pages = {
+            1: {
+                "customerpayments": [{"payment_number": "PMT-001", "amount": 100}],
+                "page_context": page_context,
+            },
+            2: {
+                "customerpayments": [{"payment_number": "PMT-201", "amount": 50}],
+                "page_context": {"has_more_page": False},
+            },
         }
+        mock_api_request.side_effect = lambda method, path, params: pages[params["page"]]
         
-        # Import and call the resource function directly
-        from zoho_mcp.resources import register_resources
-        mcp = MagicMock()
-        
-        # Capture the overdue invoices function
-        overdue_func = None
-        def capture_overdue(uri):
-            def decorator(func):
-                nonlocal overdue_func
-                if uri == "invoice://overdue":
-                    overdue_func = func
-                return func
-            return decorator
-        
-        mcp.resource = capture_overdue
-        register_resources(mcp)
+        result = await resource_funcs["payment://recent"]()
         
-        # Call the captured function
-        result = await overdue_func()
+        # Both pages are requested at the maximum page size
+        requested = [call.kwargs["params"] for call in mock_api_request.call_args_list]
+        assert [params["page"] for params in requested] == [1, 2]
+        assert all(params["per_page"] == 200 for params in requested)
         
-        # Verify the result
-        assert isinstance(result, Resource)
-        assert result.uri == "invoice://overdue"
-        assert result.name == "Overdue Invoices"
-        
-        # Check content includes invoice details
-        content = result.contents[0].text
-        assert "INV-001" in content
-        assert "Test Customer" in content
-        assert "$500.00" in content
+        # Payments from both pages are listed and totalled
+        assert "**Total Payments**: 2" in result
+        assert "Payment #PMT-201" in result
+        assert "**Total Received**: 150.00" in result
     
-    @pytest.mark.asyncio
-    async def test_contact_details_resource_direct(self, mock_tools):
-        """Test the contact details resource function directly."""
-        # Import and call the resource function directly
-        from zoho_mcp.resources import register_resources
-        mcp = MagicMock()
-        
-        # Capture the contact details function
-        contact_func = None
-        def capture_contact(uri):
-            def decorator(func):
-                nonlocal contact_func
-                if uri == "contact://{contact_id}":
-                    contact_func = func
-                return func
-            return decorator
-        
-        mcp.resource = capture_contact
-        register_resources(mcp)
-        
-        # Call the captured function
-        result = await contact_func("contact_123")
-        
-        # Verify the result
-        assert isinstance(result, Resource)
-        assert result.uri == "contact://contact_123"
-        assert result.name == "Contact: Test Customer"
-        
-        # Check that get_contact was called with the correct ID
-        mock_tools["get_contact"].assert_called_once_with("contact_123")
-        
-        # Check content includes contact details
-        content = result.contents[0].text
-        assert "Test Customer" in content
-        assert "test@example.com" in content
-        assert "123-456-7890" in content
+    async def test_recent_payments_limits_concurrent_pages(self, resource_funcs, mock_api_request):
+        """Test that remaining pages are fetched at most MAX_CONCURRENT_PAGES at a time."""
+        in_flight = 0
+        peak = 0
+        
+        async def fetch(method, path, params):
+            nonlocal in_flight, peak
+            if params["page"] == 1:
+                return {"customerpayments": [], "page_context": {"total": MAX_PAGE_SIZE * 10}}
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"customerpayments": [{"payment_number": f"PMT-{params['page']}", "amount": 1}]}
+        
+        mock_api_request.side_effect = fetch
+        
+        result = await resource_funcs["payment://recent"]()
+        
+        assert mock_api_request.call_count == 10
+        assert peak == MAX_CONCURRENT_PAGES
+        assert "**Total Payments**: 9" in result
     
-    @pytest.mark.asyncio  
-    async def test_contact_list_resource_direct(self, mock_tools):
-        """Test the contact list resource function directly."""
-        # Import and call the resource function directly
-        from zoho_mcp.resources import register_resources
-        mcp = MagicMock()
-        
-        # Capture the contact list function
-        list_func = None
-        def capture_list(uri):
-            def decorator(func):
-                nonlocal list_func
-                if uri == "contact://list":
-                    list_func = func
-                return func
-            return decorator
-        
-        mcp.resource = capture_list
-        register_resources(mcp)
+    async def test_overdue_days_from_due_date(self, resource_funcs):
+        """Test that days overdue are derived from the due date when Zoho omits them."""
+        due_date = (date.today() - timedelta(days=5)).isoformat()
+        invoices = {"invoices": [{"invoice_number": "INV-001", "balance": 10, "due_date": due_date}]}
         
-        # Call the captured function
-        result = await list_func()
+        with patch("zoho_mcp.resources.list_invoices", AsyncMock(return_value=invoices)):
+            result = await resource_funcs["invoice://overdue"]()
         
-        # Verify the result
-        assert isinstance(result, Resource)
-        assert result.uri == "contact://list"
-        assert result.name == "Contact List"
-        
-        # Check that list_contacts was called
-        mock_tools["list_contacts"].assert_called_once_with(page_size=100)
-        
-        # Check content includes contact details
-        content = result.contents[0].text
-        assert "Test Customer" in content
-        assert "customer" in content
-        assert "test@example.com" in content
\ No newline at end of file
+        assert "**Days Overdue**: 5" in result
+    
+    async def test_unpaid_invoices_resource_direct(self, resource_funcs, mock_tools):
+        """Test the unpaid invoices resource with the patched invoice tool."""
+        result = await resource_funcs["invoice://unpaid"]()
+        
+        mock_tools["list_invoices"].assert_awaited_once_with(
+            status="unpaid", sort_column="date", sort_order="descending", page_size=50
+        )
+        assert "**Total Unpaid Amount**: 400.00" in result
+        assert "**Overdue Invoices**: 1" in result
+        assert "🔴 Invoice #INV-001" in result
+    
+    async def test_overdue_invoices_resource_uses_tool(self, resource_funcs, mock_tools):
+        """Test the overdue invoices resource with the patched invoice tool."""
+        result = await resource_funcs["invoice://overdue"]()
+        
+        mock_tools["list_invoices"].assert_awaited_once_with(
+            status="overdue", sort_column="due_date", sort_order="ascending", page_size=50
+        )
+        assert "**Total Overdue Amount**: 400.00" in result
+        assert "- **Customer**: Test Customer" in result
+
+
+@pytest.mark.parametrize(
+    "due_date, expected",
+    [
+        ("2023-01-01", 9),
+        ("2023-01-10", 0),
+        ("2023-02-01", 0),
+        (None, 0),
+        ("not a date", 0),
+    ],
+)
+def test_days_past_due(due_date, expected):
+    """Test counting days past a YYYY-MM-DD due date."""
+    assert _days_past_due(due_date, date(2023, 1, 10).toordinal()) == expected
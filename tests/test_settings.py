@@ -0,0 +1,134 @@
+"""
+Test suite for loading settings from the environment and the .env file.
+"""
+
+import importlib
+import os
+import subprocess
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+from zoho_mcp.config.settings import get_settings
+
+# The package re-exports the Settings instance as ``settings``, so fetch the module itself
+settings_module = importlib.import_module("zoho_mcp.config.settings")
+
+
+@pytest.fixture
+def env_file(tmp_path, monkeypatch):
+    """Point the settings at a temporary .env file and record each load."""
+    path = tmp_path / ".env"
+    path.write_text("ZOHO_ORGANIZATION_ID=org-1\n")
+
+    load_dotenv = MagicMock()
+    monkeypatch.setattr(settings_module, "home_env_path", path)
+    monkeypatch.setattr(settings_module, "local_env_path", tmp_path / "missing" / ".env")
+    monkeypatch.setattr(settings_module, "_DOTENV_MTIME", None)
+    monkeypatch.setattr(settings_module, "load_dotenv", load_dotenv)
+
+    get_settings.cache_clear()
+    yield path, load_dotenv
+    get_settings.cache_clear()
+
+
+class TestLoadDotenv:
+    """Test suite for the .env modification time guard."""
+
+    def test_unchanged_file_is_not_parsed_again(self, env_file):
+        """Test that rebuilding the settings skips an unchanged .env file."""
+        path, load_dotenv = env_file
+
+        get_settings()
+        get_settings.cache_clear()
+        get_settings()
+
+        load_dotenv.assert_called_once_with(dotenv_path=str(path), override=False)
+
+    def test_touched_file_is_parsed_again(self, env_file):
+        """Test that a new modification time loads the .env file again."""
+        path, load_dotenv = env_file
+
+        get_settings()
+        mtime = path.stat().st_mtime + 10
+        os.utime(path, (mtime, mtime))
+        get_settings.cache_clear()
+        get_settings()
+
+        assert load_dotenv.call_count == 2
+
+
+class TestSettings:
+    """Test suite for the Settings class and the lazy module attribute."""
+
+    def test_reads_values_from_environment(self, monkeypatch):
+        """Test that settings are parsed from the environment when created."""
+        monkeypatch.setenv("ZOHO_REGION", "EU # inline comment")
+        monkeypatch.setenv("DEFAULT_PORT", "9000")
+        monkeypatch.setenv("LOG_INCLUDE_REQUEST_BODY", "yes")
+
+        config = settings_module.Settings()
+
+        assert config.ZOHO_REGION == "EU"
+        assert config.ZOHO_AUTH_BASE_URL == "https://accounts.zoho.eu/oauth/v2"
+        assert config.DEFAULT_PORT == 9000
+        assert config.LOG_INCLUDE_REQUEST_BODY is True
+
+    def test_environment_is_read_once_at_creation(self, monkeypatch):
+        """Test that later environment changes don't alter an existing instance."""
+        monkeypatch.setenv("ZOHO_ORGANIZATION_ID", "org-1")
+        config = settings_module.Settings()
+
+        monkeypatch.setenv("ZOHO_ORGANIZATION_ID", "org-2")
+
+        assert config.ZOHO_ORGANIZATION_ID == "org-1"
+
+    def test_as_dict_lists_every_setting(self, monkeypatch):
+        """Test that as_dict returns each declared setting with its value."""
+        monkeypatch.setenv("ZOHO_CLIENT_ID", "client-id")
+        monkeypatch.setenv("ZOHO_CLIENT_SECRET", "client-secret")
+
+        values = settings_module.Settings().as_dict()
+
+        assert set(values) == set(settings_module.Settings._FIELDS)
+        assert values["ZOHO_CLIENT_ID"] == "client-id"
+        assert values["ZOHO_CLIENT_SECRET"] == "client-secret"
+
+    def test_instances_have_no_dict(self):
+        """Test that only the declared settings can be set on an instance."""
+        config = settings_module.Settings()
+
+        assert not hasattr(config, "__dict__")
+        with pytest.raises(AttributeError):
+            config.NOT_A_SETTING = "value"
+
+    def test_module_attribute_is_shared_instance(self):
+        """Test that the module's settings attribute resolves to get_settings()."""
+        assert settings_module.settings is get_settings()
+
+    def test_unknown_module_attribute_raises(self):
+        """Test that other missing module attributes still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            settings_module.not_a_setting
+
+    def test_package_attribute_is_shared_instance(self):
+        """Test that the config package's settings attribute resolves to get_settings()."""
+        config_package = importlib.import_module("zoho_mcp.config")
+
+        assert config_package.settings is get_settings()
+
+    def test_importing_prompts_does_not_build_settings(self):
+        """Test that importing a module that never reads settings leaves them unbuilt."""
+        # A fresh interpreter, since this process has already built the settings
+        code = (
+            "import zoho_mcp.prompts\n"
+            "from zoho_mcp.config.settings import get_settings\n"
+            "print(get_settings.cache_info().currsize)\n"
+        )
+
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "0"
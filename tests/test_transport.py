@@ -139,6 +139,20 @@ class TestTransportUtilities(unittest.TestCase):
         args = parser.parse_args(["--stdio", "--disable-cors"])
         self.assertTrue(args.disable_cors)
 
+    def test_setup_argparser_selftest(self):
+        """Test that --selftest prints usage and version, then exits cleanly."""
+        parser = setup_argparser()
+        with patch("sys.stdout") as mock_stdout, patch("sys.stderr") as mock_stderr:
+            with self.assertRaises(SystemExit) as context:
+                parser.parse_args(["--selftest"])
+
+        self.assertEqual(context.exception.code, 0)
+        output = "".join(c.args[0] for c in mock_stdout.write.call_args_list)
+        self.assertIn("usage:", output)
+        self.assertIn("Zoho MCP Server v0.1.0", output)
+        self.assertIn("selftest: ok", output)
+        mock_stderr.write.assert_not_called()
+
 
 class TestTransportConfiguration(unittest.TestCase):
     """Tests for transport configuration functions."""
@@ -9,7 +9,6 @@ from .progress import (
     BulkOperationProgress,
     create_progress_tracker
 )
-from .server import main as server_main
 
 __version__ = "0.1.0"
 
@@ -21,4 +20,6 @@ __all__ = [
 
 def main():
     """Console script entry point for uvx compatibility."""
+    # Imported here so importing the package doesn't load the settings
+    from .server import main as server_main
     server_main()
@@ -9,6 +9,7 @@ import logging
 import time
 import webbrowser
 import json
+import re
 import threading
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse, parse_qs
@@ -23,6 +24,9 @@ from zoho_mcp.logging import set_request_context
 
 logger = logging.getLogger(__name__)
 
+# Matches KEY=VALUE lines in a .env file, skipping blank lines and comments
+_ENV_LINE_RE = re.compile(r"^[ \t]*([^#\s=][^=\n]*?)[ \t]*=(.*)$", re.MULTILINE)
+
 # HTML response templates
 SUCCESS_HTML = """<!DOCTYPE html>
 <html>
@@ -225,36 +229,23 @@ def update_env_file(refresh_token: str) -> None:
     # Create config directory if it doesn't exist
     env_path.parent.mkdir(parents=True, exist_ok=True)
     
-    env_content = ""
-    env_dict = {}
+    env_dict: Dict[str, str] = {}
     
-    # Read existing .env file if it exists
+    # Parse existing variables if the .env file exists
     if env_path.exists():
-        with open(env_path, "r") as f:
-            env_content = f.read()
-        
-        # Parse existing variables
-        for line in env_content.splitlines():
-            line = line.strip()
-            if line and not line.startswith('#') and '=' in line:
-                key, value = line.split('=', 1)
-                env_dict[key.strip()] = value.strip().strip('"\'')
+        env_dict = {
+            match.group(1): match.group(2).strip().strip('"\'')
+            for match in _ENV_LINE_RE.finditer(env_path.read_text())
+        }
     
     # Update or add the refresh token
     env_dict["ZOHO_REFRESH_TOKEN"] = refresh_token
     
-    # Reconstruct the .env file
-    env_lines = []
-    for key, value in env_dict.items():
-        # Quote the value if it contains spaces
-        if ' ' in value:
-            env_lines.append(f'{key}="{value}"')
-        else:
-            env_lines.append(f'{key}={value}')
-    
-    # Write back to the .env file
-    with open(env_path, "w") as f:
-        f.write('\n'.join(env_lines) + '\n')
+    # Write back to the .env file, quoting values that contain spaces
+    env_path.write_text("".join(
+        f'{key}="{value}"\n' if ' ' in value else f'{key}={value}\n'
+        for key, value in env_dict.items()
+    ))
     
     logger.info(f"Updated refresh token in {env_path}")
 
@@ -4,16 +4,21 @@ Bulk operation utilities for Zoho Books MCP Integration.
 This module provides utilities for performing bulk operations with progress tracking.
 """
 
+import asyncio
 import logging
 from typing import Dict, Any, List, Optional, Callable
 from datetime import datetime
 
 from zoho_mcp.progress import BulkOperationProgress
+from zoho_mcp.tools.contacts import create_customer
 from zoho_mcp.tools.invoices import create_invoice
 from zoho_mcp.tools.expenses import create_expense
 
 logger = logging.getLogger(__name__)
 
+# Customer creations in flight at once over the shared connection pool
+MAX_CONCURRENT_CREATES = 8
+
 
 async def bulk_create_invoices(
     invoices_data: List[Dict[str, Any]],
@@ -85,6 +90,76 @@ async def bulk_create_invoices(
     }
 
 
+async def bulk_create_customers(
+    customers_data: List[Dict[str, Any]],
+    callback: Optional[Callable[[int, int], None]] = None
+) -> Dict[str, Any]:
+    """
+    Create multiple customers concurrently with progress tracking.
+    
+    Up to MAX_CONCURRENT_CREATES requests share the API client's connection
+    pool at once; rate-limited requests are retried by the API layer.
+    
+    Args:
+        customers_data: List of customer data dictionaries
+        callback: Optional callback for progress notifications
+        
+    Returns:
+        Dictionary with results including successful and failed customers
+    """
+    total = len(customers_data)
+    logger.info(f"Starting bulk customer creation: {total} customers")
+    
+    successful = []
+    failed = []
+    slots = asyncio.Semaphore(MAX_CONCURRENT_CREATES)
+    
+    async with BulkOperationProgress(
+        total,
+        "Bulk customer creation",
+        callback=callback
+    ) as progress:
+        async def create_one(idx: int, customer_data: Dict[str, Any]) -> None:
+            async with slots:
+                try:
+                    result = await create_customer(**customer_data)
+                    
+                    successful.append({
+                        "index": idx,
+                        "contact_id": (result.get("contact") or {}).get("contact_id"),
+                        "contact_name": (result.get("contact") or {}).get("contact_name"),
+                    })
+                    
+                except Exception as e:
+                    logger.error(f"Failed to create customer {idx + 1}: {str(e)}")
+                    failed.append({
+                        "index": idx,
+                        "contact_name": customer_data.get("contact_name"),
+                        "error": str(e),
+                    })
+            
+            # Update progress
+            await progress.async_increment()
+        
+        await asyncio.gather(*(
+            create_one(idx, customer_data) for idx, customer_data in enumerate(customers_data)
+        ))
+    
+    # Requests finish in any order; report them in input order
+    successful.sort(key=lambda customer: customer["index"])
+    failed.sort(key=lambda customer: customer["index"])
+    
+    return {
+        "summary": {
+            "total_requested": total,
+            "successful": len(successful),
+            "failed": len(failed),
+        },
+        "successful_customers": successful,
+        "failed_customers": failed,
+    }
+
+
 async def bulk_record_expenses(
     expenses_data: List[Dict[str, Any]],
     callback: Optional[Callable[[int, int], None]] = None
@@ -4,6 +4,19 @@ Zoho Books MCP Integration Server Configuration
 This module loads configuration from environment variables and settings.py.
 """
 
-from .settings import settings
+from typing import Any
 
-__all__ = ["settings"]
+from .settings import Settings, get_settings
+
+# Importing the submodule binds it as ``settings`` on the package; drop that
+# so the name resolves through __getattr__ to the lazily built instance
+globals().pop("settings", None)
+
+__all__ = ["Settings", "get_settings"]
+
+
+def __getattr__(name: str) -> Any:
+    """Build the settings singleton lazily on first access (PEP 562)."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
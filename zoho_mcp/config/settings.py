@@ -5,25 +5,57 @@ This module loads configuration from environment variables.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Final, Mapping, Optional, Tuple
 from dotenv import load_dotenv
 
-# Load environment variables from .env file if it exists
+# Project-level config directory, resolved once
+_CONFIG_DIR: Final[Path] = Path(__file__).resolve().parents[2] / "config"
+
+# Locations of the .env file
 # First try the home directory location
 home_env_path = Path.home() / ".zoho-mcp" / ".env"
 # Then try the local project location for backward compatibility
-local_env_path = Path(__file__).parent.parent.parent / "config" / ".env"
+local_env_path = _CONFIG_DIR / ".env"
+
+# Modification time of the .env file at the last load (0.0 when none was found)
+_DOTENV_MTIME: Optional[float] = None
+
+
+def _load_dotenv_if_stale() -> None:
+    """
+    Load environment variables from the .env file if it changed since the last load.
+    
+    Uses the first location that exists; with no .env file, load_dotenv falls
+    back to searching from the working directory. Variables already set in the
+    environment are never overridden.
+    """
+    global _DOTENV_MTIME
+    
+    env_path = next((p for p in (home_env_path, local_env_path) if p.exists()), None)
+    mtime = env_path.stat().st_mtime if env_path else 0.0
+    if mtime == _DOTENV_MTIME:
+        return
+    
+    load_dotenv(dotenv_path=str(env_path) if env_path else None, override=False)
+    _DOTENV_MTIME = mtime
 
-if home_env_path.exists():
-    load_dotenv(dotenv_path=str(home_env_path))
-elif local_env_path.exists():
-    load_dotenv(dotenv_path=str(local_env_path))
-else:
-    # If no .env file exists, load from environment variables
-    load_dotenv()
 
+# Zoho domain for each region code
+_REGION_MAP: Final[Mapping[str, str]] = MappingProxyType({
+    "US": "com",
+    "EU": "eu",
+    "IN": "in",
+    "AU": "com.au",
+    "JP": "jp",
+    "CN": "com.cn",
+    "CA": "ca",
+})
 
+
+@lru_cache(maxsize=16)
 def _get_domain(region: str) -> str:
     """
     Get the domain for the Zoho region.
@@ -34,16 +66,16 @@ def _get_domain(region: str) -> str:
     Returns:
         The domain for the region (com, eu, in, com.au, etc.)
     """
-    region_map = {
-        "US": "com",
-        "EU": "eu",
-        "IN": "in",
-        "AU": "com.au",
-        "JP": "jp",
-        "CN": "com.cn",
-        "CA": "ca",
-    }
-    return region_map.get(region.upper(), "com")
+    return _REGION_MAP.get(region) or _REGION_MAP.get(region.upper(), "com")
+
+
+# Settings that must be non-empty for the server to talk to Zoho
+_REQUIRED: Final[Tuple[str, ...]] = (
+    "ZOHO_CLIENT_ID",
+    "ZOHO_CLIENT_SECRET",
+    "ZOHO_REFRESH_TOKEN",
+    "ZOHO_ORGANIZATION_ID",
+)
 
 
 class Settings:
@@ -51,79 +83,129 @@ class Settings:
     Settings class to manage configuration for the MCP server.
     Pulls values from environment variables with defaults.
     """
-    # Zoho API credentials
-    ZOHO_CLIENT_ID: str = os.environ.get("ZOHO_CLIENT_ID", "")
-    ZOHO_CLIENT_SECRET: str = os.environ.get("ZOHO_CLIENT_SECRET", "")
-    ZOHO_REFRESH_TOKEN: str = os.environ.get("ZOHO_REFRESH_TOKEN", "")
-    ZOHO_ORGANIZATION_ID: str = os.environ.get("ZOHO_ORGANIZATION_ID", "")
     
-    # Zoho API URLs
-    # Strip any inline comments from environment variables
-    _zoho_region = os.environ.get("ZOHO_REGION", "US")
-    ZOHO_REGION: str = _zoho_region.split("#")[0].strip() if isinstance(_zoho_region, str) else "US"
-    ZOHO_API_BASE_URL: str = os.environ.get(
-        "ZOHO_API_BASE_URL", "https://www.zohoapis.com/books/v3"
-    )
-    domain = _get_domain(ZOHO_REGION)
-    ZOHO_AUTH_BASE_URL: str = os.environ.get(
-        "ZOHO_AUTH_BASE_URL", f"https://accounts.zoho.{domain}/oauth/v2"
-    )
-    ZOHO_OAUTH_SCOPE: str = os.environ.get(
+    # Public setting names, in the order they are assigned in __init__
+    _FIELDS: Tuple[str, ...] = (
+        "ZOHO_CLIENT_ID",
+        "ZOHO_CLIENT_SECRET",
+        "ZOHO_REFRESH_TOKEN",
+        "ZOHO_ORGANIZATION_ID",
+        "ZOHO_REGION",
+        "ZOHO_API_BASE_URL",
+        "ZOHO_AUTH_BASE_URL",
         "ZOHO_OAUTH_SCOPE",
-        "ZohoBooks.fullaccess.all",
-    )
-    
-    # Token management
-    TOKEN_CACHE_PATH: str = os.environ.get(
-        "TOKEN_CACHE_PATH", 
-        str(Path.home() / ".zoho-mcp" / ".token_cache")
-    )
-    
-    # Logging
-    # Strip any inline comments from environment variables
-    _log_level = os.environ.get("LOG_LEVEL", "INFO")
-    LOG_LEVEL: str = _log_level.split("#")[0].strip() if isinstance(_log_level, str) else "INFO"
-    LOG_FORMAT: str = os.environ.get(
-        "LOG_FORMAT", "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+        "TOKEN_CACHE_PATH",
+        "LOG_LEVEL",
+        "LOG_FORMAT",
+        "LOG_FILE_PATH",
+        "LOG_FORMAT_JSON",
+        "LOG_MAX_BYTES",
+        "LOG_BACKUP_COUNT",
+        "LOG_SANITIZE_ENABLED",
+        "LOG_INCLUDE_REQUEST_BODY",
+        "LOG_INCLUDE_RESPONSE_BODY",
+        "DEFAULT_PORT",
+        "DEFAULT_HOST",
+        "DEFAULT_WS_PORT",
+        "CORS_ORIGINS",
+        "HTTP_KEEPALIVE",
+        "HTTP_READ_TIMEOUT",
+        "WS_PING_INTERVAL",
+        "WS_PING_TIMEOUT",
+        "RATE_LIMIT_ENABLED",
+        "RATE_LIMIT_REQUESTS",
+        "RATE_LIMIT_WINDOW",
+        "ENABLE_SECURE_TRANSPORT",
+        "SSL_CERT_PATH",
+        "SSL_KEY_PATH",
+        "SSL_ENABLED",
+        "REQUEST_TIMEOUT",
+        "MAX_RETRIES",
     )
-    LOG_FILE_PATH: str = os.environ.get("LOG_FILE_PATH", "")
-    LOG_FORMAT_JSON: bool = os.environ.get("LOG_FORMAT_JSON", "False").lower() in ["true", "1", "yes"]
-    LOG_MAX_BYTES: int = int(os.environ.get("LOG_MAX_BYTES", "10485760"))  # 10MB
-    LOG_BACKUP_COUNT: int = int(os.environ.get("LOG_BACKUP_COUNT", "5"))
-    LOG_SANITIZE_ENABLED: bool = os.environ.get("LOG_SANITIZE_ENABLED", "True").lower() in ["true", "1", "yes"]
-    LOG_INCLUDE_REQUEST_BODY: bool = os.environ.get("LOG_INCLUDE_REQUEST_BODY", "False").lower() in ["true", "1", "yes"]
-    LOG_INCLUDE_RESPONSE_BODY: bool = os.environ.get("LOG_INCLUDE_RESPONSE_BODY", "False").lower() in ["true", "1", "yes"]
     
-    # Server settings
-    DEFAULT_PORT: int = int(os.environ.get("DEFAULT_PORT", "8000"))
-    DEFAULT_HOST: str = os.environ.get("DEFAULT_HOST", "127.0.0.1")
-    DEFAULT_WS_PORT: int = int(os.environ.get("DEFAULT_WS_PORT", "8765"))
+    # No per-instance __dict__: every attribute set in __init__ gets a slot
+    __slots__ = _FIELDS + ("domain",)
     
-    # Transport-specific settings
-    CORS_ORIGINS: list = os.environ.get("CORS_ORIGINS", "*").split(",")
-    HTTP_KEEPALIVE: bool = os.environ.get("HTTP_KEEPALIVE", "True").lower() in ["true", "1", "yes"]
-    HTTP_READ_TIMEOUT: int = int(os.environ.get("HTTP_READ_TIMEOUT", "30"))
-    WS_PING_INTERVAL: int = int(os.environ.get("WS_PING_INTERVAL", "30"))
-    WS_PING_TIMEOUT: int = int(os.environ.get("WS_PING_TIMEOUT", "60"))
-    RATE_LIMIT_ENABLED: bool = os.environ.get("RATE_LIMIT_ENABLED", "True").lower() in ["true", "1", "yes"]
-    RATE_LIMIT_REQUESTS: int = int(os.environ.get("RATE_LIMIT_REQUESTS", "100"))
-    RATE_LIMIT_WINDOW: int = int(os.environ.get("RATE_LIMIT_WINDOW", "60"))  # in seconds
-    
-    # Security settings
-    ENABLE_SECURE_TRANSPORT: bool = os.environ.get("ENABLE_SECURE_TRANSPORT", "False").lower() in ["true", "1", "yes"]
-    SSL_CERT_PATH: str = os.environ.get("SSL_CERT_PATH", "")
-    SSL_KEY_PATH: str = os.environ.get("SSL_KEY_PATH", "")
-    
-    # Timeouts and retries
-    REQUEST_TIMEOUT: int = int(os.environ.get("REQUEST_TIMEOUT", "60"))
-    MAX_RETRIES: int = int(os.environ.get("MAX_RETRIES", "3"))
+    def __init__(self) -> None:
+        """Read every setting from a single snapshot of the environment."""
+        env = os.environ.copy()
+        
+        # Zoho API credentials
+        self.ZOHO_CLIENT_ID: str = env.get("ZOHO_CLIENT_ID", "")
+        self.ZOHO_CLIENT_SECRET: str = env.get("ZOHO_CLIENT_SECRET", "")
+        self.ZOHO_REFRESH_TOKEN: str = env.get("ZOHO_REFRESH_TOKEN", "")
+        self.ZOHO_ORGANIZATION_ID: str = env.get("ZOHO_ORGANIZATION_ID", "")
+        
+        # Zoho API URLs
+        # Strip any inline comments from environment variables
+        region = env.get("ZOHO_REGION", "US").split("#")[0].strip()
+        self.ZOHO_REGION: str = region
+        self.ZOHO_API_BASE_URL: str = env.get(
+            "ZOHO_API_BASE_URL", "https://www.zohoapis.com/books/v3"
+        )
+        self.domain: str = _get_domain(region)
+        self.ZOHO_AUTH_BASE_URL: str = env.get(
+            "ZOHO_AUTH_BASE_URL", f"https://accounts.zoho.{self.domain}/oauth/v2"
+        )
+        self.ZOHO_OAUTH_SCOPE: str = env.get(
+            "ZOHO_OAUTH_SCOPE",
+            "ZohoBooks.fullaccess.all",
+        )
+        
+        # Token management
+        self.TOKEN_CACHE_PATH: str = env.get(
+            "TOKEN_CACHE_PATH", 
+            str(Path.home() / ".zoho-mcp" / ".token_cache")
+        )
+        
+        # Logging
+        # Strip any inline comments from environment variables
+        self.LOG_LEVEL: str = env.get("LOG_LEVEL", "INFO").split("#")[0].strip()
+        self.LOG_FORMAT: str = env.get(
+            "LOG_FORMAT", "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+        )
+        self.LOG_FILE_PATH: str = env.get("LOG_FILE_PATH", "")
+        self.LOG_FORMAT_JSON: bool = env.get("LOG_FORMAT_JSON", "False").lower() in ["true", "1", "yes"]
+        self.LOG_MAX_BYTES: int = int(env.get("LOG_MAX_BYTES", "10485760"))  # 10MB
+        self.LOG_BACKUP_COUNT: int = int(env.get("LOG_BACKUP_COUNT", "5"))
+        self.LOG_SANITIZE_ENABLED: bool = env.get("LOG_SANITIZE_ENABLED", "True").lower() in ["true", "1", "yes"]
+        self.LOG_INCLUDE_REQUEST_BODY: bool = env.get(
+            "LOG_INCLUDE_REQUEST_BODY", "False"
+        ).lower() in ["true", "1", "yes"]
+        self.LOG_INCLUDE_RESPONSE_BODY: bool = env.get(
+            "LOG_INCLUDE_RESPONSE_BODY", "False"
+        ).lower() in ["true", "1", "yes"]
+        
+        # Server settings
+        self.DEFAULT_PORT: int = int(env.get("DEFAULT_PORT", "8000"))
+        self.DEFAULT_HOST: str = env.get("DEFAULT_HOST", "127.0.0.1")
+        self.DEFAULT_WS_PORT: int = int(env.get("DEFAULT_WS_PORT", "8765"))
+        
+        # Transport-specific settings
+        self.CORS_ORIGINS: list = env.get("CORS_ORIGINS", "*").split(",")
+        self.HTTP_KEEPALIVE: bool = env.get("HTTP_KEEPALIVE", "True").lower() in ["true", "1", "yes"]
+        self.HTTP_READ_TIMEOUT: int = int(env.get("HTTP_READ_TIMEOUT", "30"))
+        self.WS_PING_INTERVAL: int = int(env.get("WS_PING_INTERVAL", "30"))
+        self.WS_PING_TIMEOUT: int = int(env.get("WS_PING_TIMEOUT", "60"))
+        self.RATE_LIMIT_ENABLED: bool = env.get("RATE_LIMIT_ENABLED", "True").lower() in ["true", "1", "yes"]
+        self.RATE_LIMIT_REQUESTS: int = int(env.get("RATE_LIMIT_REQUESTS", "100"))
+        self.RATE_LIMIT_WINDOW: int = int(env.get("RATE_LIMIT_WINDOW", "60"))  # in seconds
+        
+        # Security settings
+        self.ENABLE_SECURE_TRANSPORT: bool = env.get("ENABLE_SECURE_TRANSPORT", "False").lower() in ["true", "1", "yes"]
+        self.SSL_CERT_PATH: str = env.get("SSL_CERT_PATH", "")
+        self.SSL_KEY_PATH: str = env.get("SSL_KEY_PATH", "")
+        self.SSL_ENABLED: bool = bool(
+            self.ENABLE_SECURE_TRANSPORT and self.SSL_CERT_PATH and self.SSL_KEY_PATH
+        )
+        
+        # Timeouts and retries
+        self.REQUEST_TIMEOUT: int = int(env.get("REQUEST_TIMEOUT", "60"))
+        self.MAX_RETRIES: int = int(env.get("MAX_RETRIES", "3"))
     
     def as_dict(self) -> Dict[str, Any]:
         """Return settings as a dictionary."""
-        return {
-            key: value for key, value in self.__dict__.items()
-            if not key.startswith("_") and key.isupper()
-        }
+        return {key: getattr(self, key) for key in self._FIELDS}
     
     def validate(self) -> None:
         """
@@ -132,15 +214,7 @@ class Settings:
         Raises:
             ValueError: If any required setting is missing.
         """
-        required_settings = [
-            "ZOHO_CLIENT_ID",
-            "ZOHO_CLIENT_SECRET",
-            "ZOHO_REFRESH_TOKEN",
-            "ZOHO_ORGANIZATION_ID",
-        ]
-        
-        missing = [setting for setting in required_settings 
-                  if not getattr(self, setting)]
+        missing = [setting for setting in _REQUIRED if not getattr(self, setting)]
         
         if missing:
             raise ValueError(
@@ -149,5 +223,22 @@ class Settings:
             )
 
 
-# Create a singleton instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the shared Settings instance, creating it on first use.
+    
+    The .env file is only read when settings are first needed.
+    
+    Returns:
+        The singleton Settings instance
+    """
+    _load_dotenv_if_stale()
+    return Settings()
+
+
+def __getattr__(name: str) -> Any:
+    """Build the settings singleton lazily on first access (PEP 562)."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
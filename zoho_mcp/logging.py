@@ -27,6 +27,12 @@ from zoho_mcp.errors import sanitize_error_message
 # ThreadLocal storage for request contex
 _request_context = threading.local()
 
+# Numeric values for the supported log level names
+LOG_LEVELS: Dict[str, int] = {
+    name: getattr(logging, name)
+    for name in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+}
+
 
 class RequestContextFilter(logging.Filter):
     """
@@ -137,7 +143,7 @@ def setup_logging(
 
     # Determine log level
     log_level = level or settings.LOG_LEVEL
-    numeric_level = getattr(logging, log_level.upper(), logging.INFO)
+    numeric_level = LOG_LEVELS.get(log_level.upper(), logging.INFO)
     root_logger.setLevel(numeric_level)
 
     # Create formatter
@@ -334,8 +340,13 @@ def log_api_call(
         else:
             logger.info(log_msg)
 
-        # Log response body if requested and available
-        if include_response_body and 'response_body' in context:
+        # Log response body if requested and available; sanitizing and dumping
+        # a large list response is only worth it when debug logs are kept
+        if (
+            include_response_body
+            and 'response_body' in context
+            and logger.isEnabledFor(logging.DEBUG)
+        ):
             body = sanitize_request_data(context['response_body'])
             logger.debug(f"Response body: {json.dumps(body, indent=2)}")
 
@@ -0,0 +1,91 @@
+"""
+Short-lived cache for rendered MCP resource content.
+
+Resources are read-only views over Zoho Books data that changes on the order
+of minutes, so reads within a short window reuse the rendered content instead
+of calling the Zoho API again.
+"""
+
+import asyncio
+import functools
+import time
+from typing import Awaitable, Callable, Dict, Tuple
+
+# Seconds a rendered resource stays fresh
+DEFAULT_TTL = 60.0
+
+# Cache key -> (expiry on the monotonic clock, rendered content)
+_cache: Dict[str, Tuple[float, str]] = {}
+
+# Cache key -> render in progress, shared by every caller that misses meanwhile
+_pending: Dict[str, "asyncio.Future[str]"] = {}
+
+
+async def _compute_and_store(key: str, ttl: float, compute: Callable[[], Awaitable[str]]) -> str:
+    """Render the content and cache it under the key."""
+    content = await compute()
+    _cache[key] = (time.monotonic() + ttl, content)
+    return content
+
+
+async def cached(key: str, ttl: float, compute: Callable[[], Awaitable[str]]) -> str:
+    """
+    Return the cached content for a key, computing it when missing or expired.
+
+    Concurrent callers on the same event loop that miss on the same key share
+    a single compute.
+
+    Args:
+        key: Cache key, normally the resource URI
+        ttl: Seconds the computed content stays fresh
+        compute: Coroutine function that renders the content
+
+    Returns:
+        The rendered resource content
+    """
+    entry = _cache.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+
+    # Join a render already in flight on this loop rather than starting another
+    loop = asyncio.get_running_loop()
+    task = _pending.get(key)
+    if task is None or task.get_loop() is not loop:
+        task = asyncio.ensure_future(_compute_and_store(key, ttl, compute))
+        _pending[key] = task
+
+        def _forget(done: "asyncio.Future[str]") -> None:
+            if _pending.get(key) is done:
+                del _pending[key]
+
+        task.add_done_callback(_forget)
+
+    # Shield the shared render so one cancelled caller doesn't cancel the rest
+    return await asyncio.shield(task)
+
+
+def cached_resource(
+    key: str, ttl: float = DEFAULT_TTL
+) -> Callable[[Callable[[], Awaitable[str]]], Callable[[], Awaitable[str]]]:
+    """
+    Decorate a resource handler so its content is cached under the given key.
+
+    Args:
+        key: Cache key, normally the resource URI
+        ttl: Seconds the rendered content stays fresh (default: 60)
+
+    Returns:
+        A decorator wrapping the handler with the cache
+    """
+    def decorator(func: Callable[[], Awaitable[str]]) -> Callable[[], Awaitable[str]]:
+        @functools.wraps(func)
+        async def wrapper() -> str:
+            return await cached(key, ttl, func)
+        return wrapper
+    return decorator
+
+
+def clear() -> None:
+    """Drop every cached resource so the next read goes to the Zoho API."""
+    _cache.clear()
+    _pending.clear()
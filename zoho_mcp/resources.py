@@ -5,41 +5,113 @@ This module provides read-only resources for accessing Zoho Books data
 through the MCP protocol using URI patterns.
 """
 
+import asyncio
 import logging
-from datetime import datetime, timedelta
+import math
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional
 from mcp.server.fastmcp import FastMCP
 
+from zoho_mcp.resource_cache import cached_resource
 from zoho_mcp.tools.api import zoho_api_request_async
-from zoho_mcp.tools import list_invoices
+from zoho_mcp.tools.invoices import list_invoices
 
 logger = logging.getLogger(__name__)
 
+# Largest page size the Zoho Books list endpoints accept
+MAX_PAGE_SIZE = 200
+
+# Pages requested at once when the total is known, to stay under Zoho's rate limit
+MAX_CONCURRENT_PAGES = 4
+
+
+async def _fetch_all_pages(path: str, params: Dict[str, Any], key: str) -> List[Dict[str, Any]]:
+    """
+    Fetch every page of a Zoho list endpoint.
+    
+    The first page is fetched on its own. When its page_context reports a total,
+    the remaining pages are fetched concurrently, at most MAX_CONCURRENT_PAGES
+    at a time; otherwise pages are followed one at a time while has_more_page
+    is set.
+    
+    Args:
+        path: API endpoint path (e.g., "/customerpayments")
+        params: Query parameters, without page or per_page
+        key: Response key holding the records (e.g., "customerpayments")
+        
+    Returns:
+        The records from all pages, in page order
+    """
+    params = {**params, "per_page": MAX_PAGE_SIZE}
+    response = await zoho_api_request_async("GET", path, params={**params, "page": 1})
+    records = list(response.get(key, []))
+    page_context = response.get("page_context", {})
+    
+    if "total" in page_context:
+        total_pages = math.ceil(page_context["total"] / MAX_PAGE_SIZE)
+        slots = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
+        
+        async def fetch_page(page: int) -> Dict[str, Any]:
+            async with slots:
+                return await zoho_api_request_async("GET", path, params={**params, "page": page})
+        
+        responses = await asyncio.gather(*(fetch_page(page) for page in range(2, total_pages + 1)))
+        for page_response in responses:
+            records.extend(page_response.get(key, []))
+        return records
+    
+    page = 1
+    while page_context.get("has_more_page", False):
+        page += 1
+        response = await zoho_api_request_async("GET", path, params={**params, "page": page})
+        records.extend(response.get(key, []))
+        page_context = response.get("page_context", {})
+    return records
+
+
+def _days_past_due(due_date: Optional[str], today_ordinal: int) -> int:
+    """
+    Count the days since a YYYY-MM-DD due date.
+    
+    Args:
+        due_date: Due date from the invoice, if any
+        today_ordinal: Today's date as a proleptic Gregorian ordinal
+        
+    Returns:
+        Days past due, or 0 if the date is missing, malformed, or not yet reached
+    """
+    try:
+        return max(today_ordinal - date.fromisoformat(due_date).toordinal(), 0)
+    except (TypeError, ValueError):
+        return 0
+
 
 def register_resources(mcp: FastMCP) -> None:
     """
     Register all MCP resources with the server.
     
+    Rendered content is cached for a short time, so repeated reads don't
+    call the Zoho API again.
+    
     Args:
         mcp: The FastMCP server instance
     """
     
     @mcp.resource("dashboard://summary", name="Dashboard Summary", title="Business Dashboard", description="Overview of key business metrics including revenue, expenses, and cash flow", mime_type="text/plain")
+    @cached_resource("dashboard://summary")
     async def get_dashboard_summary() -> str:
         """Get business overview with key metrics."""
         logger.info("Fetching dashboard summary")
         
         try:
-            # Fetch organization info
-            org_response = await zoho_api_request_async("GET", "/organizations")
-            organization = org_response.get("organizations", [{}])[0]
+            now = datetime.now()
             
-            # Get current date for filtering
-            today = datetime.now()
-            start_of_month = today.replace(day=1).strftime("%Y-%m-%d")
-            end_of_month = today.strftime("%Y-%m-%d")
-            
-            # Fetch dashboard data
-            dashboard_response = await zoho_api_request_async("GET", "/dashboard")
+            # Fetch organization info and dashboard data concurrently
+            org_response, dashboard_response = await asyncio.gather(
+                zoho_api_request_async("GET", "/organizations"),
+                zoho_api_request_async("GET", "/dashboard"),
+            )
+            organization = org_response.get("organizations", [{}])[0]
             dashboard = dashboard_response.get("dashboard", {})
             
             # Build summary content
@@ -47,7 +119,7 @@ def register_resources(mcp: FastMCP) -> None:
 
 **Organization**: {organization.get('name', 'N/A')}
 **Currency**: {organization.get('currency_code', 'USD')}
-**Last Updated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+**Last Updated**: {now.strftime('%Y-%m-%d %H:%M:%S')}
 
 ## Key Metrics
 
@@ -77,16 +149,19 @@ def register_resources(mcp: FastMCP) -> None:
             
             return content
             
-        except Exception as e:
-            logger.error(f"Error fetching dashboard summary: {str(e)}")
+        except Exception:
+            logger.exception("Error fetching dashboard summary")
             raise
     
     @mcp.resource("invoice://overdue", name="Overdue Invoices", title="Overdue Invoices List", description="List of all invoices that are past their due date", mime_type="text/plain")
+    @cached_resource("invoice://overdue")
     async def get_overdue_invoices() -> str:
         """Get list of overdue invoices."""
         logger.info("Fetching overdue invoices")
         
         try:
+            now = datetime.now()
+            
             # Fetch overdue invoices
             invoices_response = await list_invoices(
                 status="overdue",
@@ -101,7 +176,7 @@ def register_resources(mcp: FastMCP) -> None:
             content = f"""# Overdue Invoices
 
 **Total Count**: {len(invoices)}
-**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+**Generated**: {now.strftime('%Y-%m-%d %H:%M:%S')}
 
 ## Invoice List
 
@@ -110,12 +185,17 @@ def register_resources(mcp: FastMCP) -> None:
             if not invoices:
                 content += "No overdue invoices found. Great job! 🎉\n"
             else:
-                total_overdue = sum(float(inv.get("balance", 0)) for inv in invoices)
+                total_overdue = math.fsum([float(inv.get("balance") or 0) for inv in invoices])
                 content += f"**Total Overdue Amount**: {total_overdue:,.2f}\n\n"
                 
+                # Render each entry, then join once
+                today_ordinal = now.date().toordinal()
+                sections = []
                 for invoice in invoices:
-                    days_overdue = invoice.get("overdue_days", 0)
-                    content += f"""### Invoice #{invoice.get('invoice_number', 'N/A')}
+                    days_overdue = invoice.get("overdue_days")
+                    if days_overdue is None:
+                        days_overdue = _days_past_due(invoice.get("due_date"), today_ordinal)
+                    sections.append(f"""### Invoice #{invoice.get('invoice_number', 'N/A')}
 - **Customer**: {invoice.get('customer_name', 'N/A')}
 - **Amount Due**: {invoice.get('balance', 0):,.2f} {invoice.get('currency_code', 'USD')}
 - **Due Date**: {invoice.get('due_date', 'N/A')}
@@ -123,15 +203,17 @@ def register_resources(mcp: FastMCP) -> None:
 - **Total Amount**: {invoice.get('total', 0):,.2f}
 - **Status**: {invoice.get('status', 'N/A')}
 
-"""
+""")
+                content += "".join(sections)
             
             return content
             
-        except Exception as e:
-            logger.error(f"Error fetching overdue invoices: {str(e)}")
+        except Exception:
+            logger.exception("Error fetching overdue invoices")
             raise
     
     @mcp.resource("invoice://unpaid", name="Unpaid Invoices", title="Unpaid Invoices List", description="List of all invoices that haven't been paid yet", mime_type="text/plain")
+    @cached_resource("invoice://unpaid")
     async def get_unpaid_invoices() -> str:
         """Get list of unpaid invoices."""
         logger.info("Fetching unpaid invoices")
@@ -160,7 +242,7 @@ def register_resources(mcp: FastMCP) -> None:
             if not invoices:
                 content += "No unpaid invoices found.\n"
             else:
-                total_unpaid = sum(float(inv.get("balance", 0)) for inv in invoices)
+                total_unpaid = math.fsum([float(inv.get("balance") or 0) for inv in invoices])
                 overdue_count = sum(1 for inv in invoices if inv.get("status") == "overdue")
                 
                 content += f"""**Total Unpaid Amount**: {total_unpaid:,.2f}
@@ -170,51 +252,56 @@ def register_resources(mcp: FastMCP) -> None:
 
 """
                 
+                # Render each entry, then join once
+                sections = []
                 for invoice in invoices:
-                    status_emoji = "🔴" if invoice.get("status") == "overdue" else "🟡"
-                    content += f"""### {status_emoji} Invoice #{invoice.get('invoice_number', 'N/A')}
+                    status = invoice.get("status", "N/A")
+                    status_emoji = "🔴" if status == "overdue" else "🟡"
+                    sections.append(f"""### {status_emoji} Invoice #{invoice.get('invoice_number', 'N/A')}
 - **Customer**: {invoice.get('customer_name', 'N/A')}
 - **Amount Due**: {invoice.get('balance', 0):,.2f} {invoice.get('currency_code', 'USD')}
 - **Invoice Date**: {invoice.get('date', 'N/A')}
 - **Due Date**: {invoice.get('due_date', 'N/A')}
 - **Total Amount**: {invoice.get('total', 0):,.2f}
-- **Status**: {invoice.get('status', 'N/A')}
+- **Status**: {status}
 
-"""
+""")
+                content += "".join(sections)
             
             return content
             
-        except Exception as e:
-            logger.error(f"Error fetching unpaid invoices: {str(e)}")
+        except Exception:
+            logger.exception("Error fetching unpaid invoices")
             raise
     
     @mcp.resource("payment://recent", name="Recent Payments", title="Recent Payments", description="List of payments received in the last 30 days", mime_type="text/plain")  
+    @cached_resource("payment://recent")
     async def get_recent_payments() -> str:
         """Get list of recent payments."""
         logger.info("Fetching recent payments")
         
         try:
             # Calculate date range for last 30 days
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=30)
+            now = datetime.now()
+            date_start = (now - timedelta(days=30)).strftime("%Y-%m-%d")
+            date_end = now.strftime("%Y-%m-%d")
             
             # Fetch payments
             params = {
-                "date_start": start_date.strftime("%Y-%m-%d"),
-                "date_end": end_date.strftime("%Y-%m-%d"),
+                "date_start": date_start,
+                "date_end": date_end,
                 "sort_column": "date",
                 "sort_order": "descending",
             }
             
-            payments_response = await zoho_api_request_async("GET", "/customerpayments", params=params)
-            payments = payments_response.get("customerpayments", [])
+            payments = await _fetch_all_pages("/customerpayments", params, "customerpayments")
             
             # Build content
             content = f"""# Recent Payments (Last 30 Days)
 
-**Period**: {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}
+**Period**: {date_start} to {date_end}
 **Total Payments**: {len(payments)}
-**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+**Generated**: {now.strftime('%Y-%m-%d %H:%M:%S')}
 
 ## Payment Summary
 
@@ -223,11 +310,13 @@ def register_resources(mcp: FastMCP) -> None:
             if not payments:
                 content += "No payments received in the last 30 days.\n"
             else:
-                total_received = sum(float(pmt.get("amount", 0)) for pmt in payments)
+                total_received = math.fsum([float(pmt.get("amount") or 0) for pmt in payments])
                 content += f"**Total Received**: {total_received:,.2f}\n\n## Payment List\n\n"
                 
+                # Render each entry, then join once
+                sections = []
                 for payment in payments:
-                    content += f"""### Payment #{payment.get('payment_number', 'N/A')}
+                    sections.append(f"""### Payment #{payment.get('payment_number', 'N/A')}
 - **Date**: {payment.get('date', 'N/A')}
 - **Customer**: {payment.get('customer_name', 'N/A')}
 - **Amount**: {payment.get('amount', 0):,.2f} {payment.get('currency_code', 'USD')}
@@ -235,10 +324,11 @@ def register_resources(mcp: FastMCP) -> None:
 - **Reference**: {payment.get('reference_number', 'N/A')}
 - **Invoice(s)**: {', '.join([inv.get('invoice_number', '') for inv in payment.get('invoices', [])])}
 
-"""
+""")
+                content += "".join(sections)
             
             return content
             
-        except Exception as e:
-            logger.error(f"Error fetching recent payments: {str(e)}")
+        except Exception:
+            logger.exception("Error fetching recent payments")
             raise
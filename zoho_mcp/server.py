@@ -9,14 +9,12 @@ MCP protocol. Supports STDIO, HTTP/SSE, and WebSocket transports.
 import sys
 import logging
 import argparse
-from typing import Dict, Any
+import functools
+from typing import Any, Callable, Dict, Tuple
 
 from mcp.server.fastmcp import FastMCP
 
 from .config import settings
-from . import tools
-from .resources import register_resources
-from .prompts import register_prompts
 from .transport import (
     setup_argparser,
     configure_transport_from_args,
@@ -25,7 +23,7 @@ from .transport import (
     TransportInitializationError
 )
 from .errors import ZohoMCPError, handle_exception, AuthenticationError
-from .logging import setup_logging, request_logging_context
+from .logging import setup_logging, request_logging_context, LOG_LEVELS
 from .auth_flow import run_oauth_flow
 
 # Initialize logging early in startup process
@@ -36,6 +34,70 @@ setup_logging(
 )
 logger = logging.getLogger("zoho_mcp")
 
+# Static FastMCP server configuration
+_SERVER_CONFIG: Dict[str, Any] = {
+    "name": "zoho-books",
+    "version": "1.0.0",
+}
+
+# Names of all tools exposed by the server, in registration order.
+# The tool modules are imported on first registration so that quick CLI
+# invocations (--help, --version) do not pay for importing them.
+TOOL_NAMES = (
+    # Contact management tools
+    "list_contacts",
+    "create_customer",
+    "create_vendor",
+    "get_contact",
+    "delete_contact",
+    "update_contact",
+    "email_statement",
+
+    # Invoice management tools
+    "list_invoices",
+    "create_invoice",
+    "get_invoice",
+    "email_invoice",
+    "mark_invoice_as_sent",
+    "void_invoice",
+    "record_payment",
+    "send_payment_reminder",
+
+    # Expense management tools
+    "list_expenses",
+    "create_expense",
+    "get_expense",
+    "update_expense",
+    "categorize_expense",
+    "upload_receipt",
+
+    # Item management tools
+    "list_items",
+    "create_item",
+    "get_item",
+    "update_item",
+
+    # Sales order management tools
+    "list_sales_orders",
+    "create_sales_order",
+    "get_sales_order",
+    "update_sales_order",
+    "convert_to_invoice",
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_tools() -> Tuple[Callable[..., Any], ...]:
+    """
+    Import the tool modules and resolve TOOL_NAMES to their functions.
+
+    Returns:
+        Tuple of tool functions in registration order, built once per process
+    """
+    from . import tools
+
+    return tuple(getattr(tools, name) for name in TOOL_NAMES)
+
 
 def register_tools(mcp_server: FastMCP) -> None:
     """
@@ -44,48 +106,9 @@ def register_tools(mcp_server: FastMCP) -> None:
     Args:
         mcp_server: The FastMCP server instance
     """
-    # Register contact management tools
-    mcp_server.add_tool(tools.list_contacts)
-    mcp_server.add_tool(tools.create_customer)
-    mcp_server.add_tool(tools.create_vendor)
-    mcp_server.add_tool(tools.get_contact)
-    mcp_server.add_tool(tools.delete_contact)
-    mcp_server.add_tool(tools.update_contact)
-    mcp_server.add_tool(tools.email_statement)
-
-    # Register invoice management tools
-    mcp_server.add_tool(tools.list_invoices)
-    mcp_server.add_tool(tools.create_invoice)
-    mcp_server.add_tool(tools.get_invoice)
-    mcp_server.add_tool(tools.email_invoice)
-    mcp_server.add_tool(tools.mark_invoice_as_sent)
-    mcp_server.add_tool(tools.void_invoice)
-    mcp_server.add_tool(tools.record_payment)
-    mcp_server.add_tool(tools.send_payment_reminder)
-
-    # Register expense management tools
-    mcp_server.add_tool(tools.list_expenses)
-    mcp_server.add_tool(tools.create_expense)
-    mcp_server.add_tool(tools.get_expense)
-    mcp_server.add_tool(tools.update_expense)
-    mcp_server.add_tool(tools.categorize_expense)
-    mcp_server.add_tool(tools.upload_receipt)
-
-    # Register item management tools
-    mcp_server.add_tool(tools.list_items)
-    mcp_server.add_tool(tools.create_item)
-    mcp_server.add_tool(tools.get_item)
-    mcp_server.add_tool(tools.update_item)
-
-    # Register sales order management tools
-    mcp_server.add_tool(tools.list_sales_orders)
-    mcp_server.add_tool(tools.create_sales_order)
-    mcp_server.add_tool(tools.get_sales_order)
-    mcp_server.add_tool(tools.update_sales_order)
-    mcp_server.add_tool(tools.convert_to_invoice)
-
-    # These tools will be registered in future tasks
-    # ...
+    add_tool = mcp_server.add_tool
+    for tool in _load_tools():
+        add_tool(tool)
 
 
 def configure_server(args: argparse.Namespace) -> Dict[str, Any]:
@@ -101,7 +124,7 @@ def configure_server(args: argparse.Namespace) -> Dict[str, Any]:
     # Override logging level if specified in command line
     if hasattr(args, 'log_level') and args.log_level:
         log_level = args.log_level
-        logging.getLogger().setLevel(getattr(logging, log_level))
+        logging.getLogger().setLevel(LOG_LEVELS[log_level])
         logger.info(f"Log level set to {log_level}")
 
     # Configure CORS for HTTP transport
@@ -109,13 +132,8 @@ def configure_server(args: argparse.Namespace) -> Dict[str, Any]:
         msg = "CORS is disabled. This is not recommended for production."
         logger.warning(msg)
 
-    # Prepare server configuration
-    server_config = {
-        "name": "zoho-books",
-        "version": "1.0.0",
-    }
-
-    return server_config
+    # Return a copy so callers can adjust it without touching the defaults
+    return dict(_SERVER_CONFIG)
 
 
 def main() -> None:
@@ -176,10 +194,12 @@ def main() -> None:
             register_tools(mcp_server)
 
             # Register all resources
+            from .resources import register_resources
             logger.info("Registering MCP resources")
             register_resources(mcp_server)
 
             # Register all prompt templates
+            from .prompts import register_prompts
             logger.info("Registering MCP prompt templates")
             register_prompts(mcp_server)
 
@@ -188,19 +208,19 @@ def main() -> None:
             logger.info(f"Configured transport: {transport_type}")
 
             # Enable SSL if configured and not using STDIO
-            if (
-                transport_type != "stdio" and
-                settings.ENABLE_SECURE_TRANSPORT and
-                settings.SSL_CERT_PATH and
-                settings.SSL_KEY_PATH
-            ):
+            if transport_type != "stdio" and settings.SSL_ENABLED:
                 logger.info("Enabling secure transport (SSL)")
                 config["ssl_certfile"] = settings.SSL_CERT_PATH
                 config["ssl_keyfile"] = settings.SSL_KEY_PATH
 
             # Start the transport
             logger.info(f"Initializing {transport_type} transport")
-            initialize_transport(mcp_server, transport_type, config)
+            try:
+                initialize_transport(mcp_server, transport_type, config)
+            finally:
+                # Release the pooled Zoho API connections once the transport stops
+                from .tools.api import close_clients
+                close_clients()
 
         except TransportConfigurationError as e:
             logger.error(f"Transport configuration error: {str(e)}")
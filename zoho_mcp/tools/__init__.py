@@ -2,8 +2,14 @@
 Zoho Books MCP Integration Server Tools
 
 This module contains all the MCP tools for interacting with Zoho Books.
+
+The tool submodules are imported on first access (PEP 562), so importing
+``zoho_mcp.tools.api`` or a single tool does not load every tool's models.
 """
 
+import importlib
+from typing import Any, Dict, Tuple
+
 from .api import (
     zoho_api_request,
     zoho_api_request_async,
@@ -14,20 +20,40 @@ from .api import (
     ZohoRateLimitError,
 )
 
-# Import contact management tools
-from .contacts import list_contacts, create_customer, create_vendor, get_contact, delete_contact, update_contact, email_statement
+# Tool functions exported by each submodule
+_TOOL_MODULES: Dict[str, Tuple[str, ...]] = {
+    # Contact management tools
+    "contacts": (
+        "list_contacts", "create_customer", "create_vendor", "get_contact", "delete_contact",
+        "update_contact", "email_statement",
+    ),
+
+    # Invoice management tools
+    "invoices": (
+        "list_invoices", "create_invoice", "get_invoice", "email_invoice",
+        "mark_invoice_as_sent", "void_invoice", "record_payment", "send_payment_reminder",
+    ),
 
-# Import invoice management tools
-from .invoices import list_invoices, create_invoice, get_invoice, email_invoice, mark_invoice_as_sent, void_invoice, record_payment, send_payment_reminder
+    # Expense management tools
+    "expenses": (
+        "list_expenses", "create_expense", "get_expense", "update_expense",
+        "categorize_expense", "upload_receipt",
+    ),
 
-# Import expense management tools
-from .expenses import list_expenses, create_expense, get_expense, update_expense, categorize_expense, upload_receipt
+    # Item management tools
+    "items": ("list_items", "create_item", "get_item", "update_item"),
 
-# Import item management tools
-from .items import list_items, create_item, get_item, update_item
+    # Sales order management tools
+    "sales": (
+        "list_sales_orders", "create_sales_order", "get_sales_order", "update_sales_order",
+        "convert_to_invoice",
+    ),
+}
 
-# Import sales order management tools
-from .sales import list_sales_orders, create_sales_order, get_sales_order, update_sales_order, convert_to_invoice
+# Tool name -> submodule that defines it
+_TOOL_TO_MODULE: Dict[str, str] = {
+    name: module for module, names in _TOOL_MODULES.items() for name in names
+}
 
 __all__ = [
     # API utilities
@@ -38,19 +64,23 @@ __all__ = [
     "ZohoAuthenticationError",
     "ZohoRequestError",
     "ZohoRateLimitError",
-    
-    # Contact management tools
-    "list_contacts", "create_customer", "create_vendor", "get_contact", "delete_contact", "update_contact", "email_statement",
-    
-    # Invoice management tools
-    "list_invoices", "create_invoice", "get_invoice", "email_invoice", "mark_invoice_as_sent", "void_invoice", "record_payment", "send_payment_reminder",
-    
-    # Expense management tools
-    "list_expenses", "create_expense", "get_expense", "update_expense", "categorize_expense", "upload_receipt",
-    
-    # Item management tools
-    "list_items", "create_item", "get_item", "update_item",
-    
-    # Sales order management tools
-    "list_sales_orders", "create_sales_order", "get_sales_order", "update_sales_order", "convert_to_invoice",
+
+    # Tools from every submodule
+    *_TOOL_TO_MODULE,
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a tool's submodule the first time the tool is looked up."""
+    module = _TOOL_TO_MODULE.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list:
+    """List the lazily exported tools alongside the loaded attributes."""
+    return sorted(set(globals()) | set(__all__))
@@ -5,19 +5,31 @@ This module handles API requests to the Zoho Books API,
 including authentication, token refresh, and error handling.
 """
 
+import contextlib
+import functools
 import json
 import time
 import logging
-import uuid
+import os
+import itertools
 import hashlib
+import importlib.util
 import asyncio
 import random
-from typing import Dict, Any, Optional, Tuple
+import threading
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple, Union
 from pathlib import Path
 from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 
 import httpx
 
+try:
+    import orjson  # Optional speedup for parsing and writing JSON
+except ImportError:
+    orjson = None
+
 from zoho_mcp.config import settings
 from zoho_mcp.errors import (
     APIError,
@@ -36,16 +48,47 @@ API_BASE_URL = settings.ZOHO_API_BASE_URL
 AUTH_BASE_URL = settings.ZOHO_AUTH_BASE_URL
 ORG_ID = settings.ZOHO_ORGANIZATION_ID
 
+# Headers sent with every API request
+_STATIC_HEADERS: Mapping[str, str] = MappingProxyType({"Content-Type": "application/json"})
+
 # Cache configuration
 CACHE_TTL = timedelta(minutes=5)  # 5-minute TTL
 _response_cache: Dict[str, Tuple[Dict[str, Any], datetime]] = {}
+_pending_requests: Dict[str, "asyncio.Future[Dict[str, Any]]"] = {}  # Cache key -> GET in flight
 
 # Rate limiting configuration
 MAX_RETRIES = 3
 INITIAL_BACKOFF = 1.0  # Initial backoff in seconds
 MAX_BACKOFF = 60.0  # Maximum backoff in seconds
 BACKOFF_MULTIPLIER = 2.0  # Exponential backoff multiplier
+MAX_RETRY_AFTER = 20.0  # Longest wait honoured from a Retry-After header
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})  # Safe to retry on 5xx
 _rate_limit_retry_after: Optional[datetime] = None  # Global rate limit retry time
+_request_ids = itertools.count(1)  # Sequence for generated request IDs
+
+# Connection pool configuration
+MAX_KEEPALIVE_CONNECTIONS = 32
+MAX_CONNECTIONS = 64
+HTTP2_ENABLED = importlib.util.find_spec("h2") is not None  # Multiplex requests when h2 is installed
+_http_version_logged = False  # Whether the negotiated HTTP version has been logged
+_async_client: Optional[httpx.AsyncClient] = None  # Shared client for async requests
+_async_client_loop: Optional[asyncio.AbstractEventLoop] = None  # Loop the client belongs to
+_sync_client: Optional[httpx.AsyncClient] = None  # Async client owned by the background loop
+_sync_loop: Optional[asyncio.AbstractEventLoop] = None  # Background loop that runs sync requests
+_sync_thread: Optional[threading.Thread] = None  # Thread running the background loop
+_sync_loop_lock = threading.Lock()  # Guards starting the background loop
+_auth_client: Optional[httpx.Client] = None  # Shared client for OAuth token refreshes
+
+# Token refresh coordination
+_refresh_lock = threading.Lock()  # Serialises token refreshes across threads
+_refresh_count = 0  # Bumped after every successful token refresh
+_refresh_future: Optional["asyncio.Future[str]"] = None  # Refresh shared by waiting coroutines
+TOKEN_EXPIRY_BUFFER_SECONDS = 300  # Refresh tokens this close to expiry instead of using them
+_token_cache: Dict[str, Any] = {}  # In-memory copy of the token cache file, plus a monotonic deadline
+
+# Credential validation cache
+VALIDATION_TTL = 300.0  # Seconds a successful validation is reused
+_last_validation: Optional[Tuple[Tuple[Any, Any], float]] = None  # ((org ID, refresh token), monotonic deadline)
 
 
 # Legacy error classes for backward compatibility
@@ -92,6 +135,39 @@ class ZohoRateLimitError(RateLimitError):
         )
 
 
+def _json_loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document, using orjson when it is installed.
+    
+    Args:
+        data: The JSON text or raw bytes
+        
+    Returns:
+        The parsed value
+        
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(value: Any) -> bytes:
+    """
+    Serialise a value to UTF-8 JSON bytes, using orjson when it is installed.
+    
+    Args:
+        value: The value to serialise
+        
+    Returns:
+        The JSON document as bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value).encode()
+
+
 def _generate_cache_key(method: str, endpoint: str, params: Optional[Dict[str, Any]], json_data: Optional[Dict[str, Any]]) -> str:
     """
     Generate a cache key for the API request.
@@ -165,13 +241,32 @@ def clear_cache() -> None:
     Clear the entire response cache.
     """
     _response_cache.clear()
+    _pending_requests.clear()
     logger.info("Response cache cleared")
 
 
-async def _handle_rate_limit_async(response: httpx.Response, attempt: int) -> float:
+def _backoff_delay(attempt: int) -> float:
+    """
+    Calculate the exponential backoff for a retry attempt, with ±25% jitter.
+    
+    Args:
+        attempt: The current retry attempt number
+        
+    Returns:
+        The number of seconds to wait before retrying
+    """
+    wait_seconds = min(INITIAL_BACKOFF * (BACKOFF_MULTIPLIER ** attempt), MAX_BACKOFF)
+    return wait_seconds + wait_seconds * 0.25 * (2 * random.random() - 1)
+
+
+def _rate_limit_delay(response: httpx.Response, attempt: int) -> float:
     """
     Handle rate limit response and calculate backoff time.
     
+    The Retry-After header is honoured in either of its forms (seconds or an
+    HTTP date), capped at MAX_RETRY_AFTER. Without a usable header, the wait
+    falls back to exponential backoff.
+    
     Args:
         response: The HTTP response with 429 status
         attempt: The current retry attempt number
@@ -181,6 +276,8 @@ async def _handle_rate_limit_async(response: httpx.Response, attempt: int) -> fl
     """
     global _rate_limit_retry_after
     
+    wait_seconds: Optional[float] = None
+    
     # Check for Retry-After header
     retry_after_header = response.headers.get("Retry-After")
     if retry_after_header:
@@ -190,17 +287,16 @@ async def _handle_rate_limit_async(response: httpx.Response, attempt: int) -> fl
         except ValueError:
             # Try to parse as HTTP date
             try:
-                retry_date = datetime.strptime(retry_after_header, "%a, %d %b %Y %H:%M:%S GMT")
+                retry_date = parsedate_to_datetime(retry_after_header)
+                if retry_date.tzinfo is None:
+                    retry_date = retry_date.replace(tzinfo=timezone.utc)
                 wait_seconds = (retry_date - datetime.now(timezone.utc)).total_seconds()
-            except ValueError:
-                # Default to exponential backoff
-                wait_seconds = min(INITIAL_BACKOFF * (BACKOFF_MULTIPLIER ** attempt), MAX_BACKOFF)
-    else:
-        # Use exponential backoff with jitter
-        wait_seconds = min(INITIAL_BACKOFF * (BACKOFF_MULTIPLIER ** attempt), MAX_BACKOFF)
-        # Add jitter (±25%)
-        jitter = wait_seconds * 0.25 * (2 * random.random() - 1)
-        wait_seconds += jitter
+            except (TypeError, ValueError):
+                pass
+    
+    if wait_seconds is None:
+        wait_seconds = _backoff_delay(attempt)
+    wait_seconds = min(max(wait_seconds, 0.0), MAX_RETRY_AFTER)
     
     # Update global rate limit retry time
     _rate_limit_retry_after = datetime.now() + timedelta(seconds=wait_seconds)
@@ -213,6 +309,65 @@ async def _handle_rate_limit_async(response: httpx.Response, attempt: int) -> fl
     return wait_seconds
 
 
+async def _handle_rate_limit_async(response: httpx.Response, attempt: int) -> float:
+    """
+    Handle rate limit response and calculate backoff time.
+    
+    Args:
+        response: The HTTP response with 429 status
+        attempt: The current retry attempt number
+        
+    Returns:
+        The number of seconds to wait before retrying
+    """
+    return _rate_limit_delay(response, attempt)
+
+
+def _should_retry(response: httpx.Response, method: str, attempt: int) -> bool:
+    """
+    Decide whether a failed response should be retried.
+    
+    Rate-limited requests are always retried, since Zoho did not process them.
+    Server errors are only retried for idempotent methods, so a POST that may
+    have gone through is never sent twice.
+    
+    Args:
+        response: The HTTP response with an error status
+        method: HTTP method of the request
+        attempt: The current retry attempt number
+        
+    Returns:
+        True if another attempt should be made
+    """
+    if attempt >= MAX_RETRIES - 1:  # Don't wait on last attempt
+        return False
+    if response.status_code == 429:
+        return True
+    return response.status_code >= 500 and method.upper() in IDEMPOTENT_METHODS
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """
+    Calculate how long to wait before retrying a failed response.
+    
+    Args:
+        response: The HTTP response with a retryable error status
+        attempt: The current retry attempt number
+        
+    Returns:
+        The number of seconds to wait before retrying
+    """
+    if response.status_code == 429:
+        return _rate_limit_delay(response, attempt)
+    
+    wait_seconds = _backoff_delay(attempt)
+    logger.warning(
+        f"Server error {response.status_code} (attempt {attempt + 1}/{MAX_RETRIES}). "
+        f"Retrying in {wait_seconds:.1f}s..."
+    )
+    return wait_seconds
+
+
 def _check_global_rate_limit() -> Optional[float]:
     """
     Check if we're still in a global rate limit wait period.
@@ -240,12 +395,12 @@ def _load_token_from_cache() -> Dict[str, Any]:
         - access_token: The OAuth access token
         - expires_at: The token expiry timestamp
     """
-    if not TOKEN_CACHE_FILE.exists():
-        return {}
-    
     try:
-        with open(TOKEN_CACHE_FILE, "r") as f:
-            return json.load(f)
+        with open(TOKEN_CACHE_FILE, "rb") as f:
+            return _json_loads(f.read())
+    except FileNotFoundError:
+        # No token has been cached yet
+        return {}
     except (json.JSONDecodeError, IOError) as e:
         logger.warning(f"Failed to load token from cache: {str(e)}")
         return {}
@@ -255,49 +410,112 @@ def _save_token_to_cache(token_data: Dict[str, Any]) -> None:
     """
     Save the OAuth token to the cache file.
     
+    The token is written to a temporary file owned by this writer and then
+    renamed over the cache file, so readers in other processes never see a
+    partially written token.
+    
     Args:
         token_data: Dictionary with token details including:
         - access_token: The OAuth access token
         - expires_at: The token expiry timestamp
     """
+    global _token_cache
+    
+    # Keep the in-memory copy current even if the file can't be written
+    _token_cache = _with_monotonic_deadline(token_data)
+    
     # Create directory if it doesn't exist
     TOKEN_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
     
+    tmp_file = TOKEN_CACHE_FILE.with_name(
+        f"{TOKEN_CACHE_FILE.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    )
     try:
-        with open(TOKEN_CACHE_FILE, "w") as f:
-            json.dump(token_data, f)
-    except IOError as e:
+        with open(tmp_file, "wb") as f:
+            f.write(_json_dumps(token_data))
+        os.replace(tmp_file, TOKEN_CACHE_FILE)
+    except OSError as e:
+        # Don't leave this writer's temporary file behind
+        with contextlib.suppress(FileNotFoundError):
+            tmp_file.unlink()
         logger.warning(f"Failed to save token to cache: {str(e)}")
 
 
-def _get_access_token(force_refresh: bool = False) -> str:
+def _with_monotonic_deadline(token_data: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Get a valid OAuth access token, refreshing if necessary.
+    Add a monotonic-clock expiry to token data from the cache file.
+    
+    The file stores a wall-clock expires_at so it stays meaningful across
+    restarts; in memory the remaining lifetime is pinned to the monotonic clock,
+    so wall-clock jumps can't make a token look fresh or stale.
     
     Args:
-        force_refresh: If True, force a token refresh regardless of expiry.
+        token_data: Token details as stored in the cache file
         
     Returns:
-        A valid OAuth access token.
+        A copy of the token data with an expires_at_monotonic deadline
+    """
+    if "expires_at" not in token_data:
+        return token_data
+    remaining = token_data["expires_at"] - time.time()
+    return {**token_data, "expires_at_monotonic": time.monotonic() + remaining}
+
+
+def _is_token_valid(token_data: Dict[str, Any]) -> bool:
+    """Check whether in-memory token data holds an access token that isn't about to expire."""
+    return (
+        "access_token" in token_data
+        and token_data.get("expires_at_monotonic", 0.0) > time.monotonic() + TOKEN_EXPIRY_BUFFER_SECONDS
+    )
+
+
+def _cached_access_token() -> Optional[str]:
+    """
+    Get the cached OAuth access token if it is still valid.
+    
+    The in-memory copy is checked first, so a valid token costs no file read.
+    The cache file is read only when that copy is missing or stale, in case
+    another process has refreshed the token since.
+    
+    Returns:
+        The cached access token, or None if it is missing or about to expire.
+    """
+    global _token_cache
+    
+    if not _is_token_valid(_token_cache):
+        _token_cache = _with_monotonic_deadline(_load_token_from_cache())
+        if not _is_token_valid(_token_cache):
+            return None
+    return _token_cache["access_token"]
+
+
+def _get_auth_client() -> httpx.Client:
+    """
+    Get the shared client for the OAuth token endpoint, creating it on first use.
+    
+    Token refreshes run under _refresh_lock, so the client is only ever
+    created by one thread at a time.
+    
+    Returns:
+        The shared httpx.Client
+    """
+    global _auth_client
+    
+    if _auth_client is None or _auth_client.is_closed:
+        _auth_client = httpx.Client(timeout=30.0, http2=HTTP2_ENABLED)
+    return _auth_client
+
+
+def _refresh_access_token() -> str:
+    """
+    Exchange the refresh token for a new OAuth access token and cache it.
+    
+    Returns:
+        The new OAuth access token.
         
     Raises:
         ZohoAuthenticationError: If unable to obtain a token.
     """
-    # Check if we have a cached and valid token
-    token_data = _load_token_from_cache()
-    current_time = time.time()
-    
-    # If we have a token and it's not expired and we're not forcing a refresh, use it
-    if (
-        not force_refresh
-        and token_data
-        and "access_token" in token_data
-        and "expires_at" in token_data
-        and token_data["expires_at"] > current_time + 60  # Add buffer
-    ):
-        logger.debug("Using cached access token")
-        return token_data["access_token"]
-    
     logger.info("Refreshing Zoho OAuth token")
     
     # Prepare the refresh token request
@@ -319,11 +537,11 @@ def _get_access_token(force_refresh: bool = False) -> str:
     }
     
     try:
-        response = httpx.post(url, params=params, timeout=30.0)
+        response = _get_auth_client().post(url, params=params)
         response.raise_for_status()
         
         # Parse the response
-        data = response.json()
+        data = _json_loads(response.content)
         
         if "access_token" not in data:
             logger.error(f"Unexpected token response: {data}")
@@ -335,7 +553,7 @@ def _get_access_token(force_refresh: bool = False) -> str:
         # Zoho tokens are valid for 1 hour (3600 seconds)
         token_data = {
             "access_token": data["access_token"],
-            "expires_at": current_time + int(data.get("expires_in", 3600)),
+            "expires_at": time.time() + int(data.get("expires_in", 3600)),
         }
         
         _save_token_to_cache(token_data)
@@ -348,7 +566,7 @@ def _get_access_token(force_refresh: bool = False) -> str:
         response_data = {}
         if e.response.content:
             try:
-                response_data = e.response.json()
+                response_data = _json_loads(e.response.content)
             except json.JSONDecodeError:
                 response_data = {}
         message = response_data.get("message", str(e))
@@ -363,6 +581,205 @@ def _get_access_token(force_refresh: bool = False) -> str:
         raise ZohoAuthenticationError(500, f"Unexpected error: {str(e)}")
 
 
+def _get_access_token(force_refresh: bool = False) -> str:
+    """
+    Get a valid OAuth access token, refreshing if necessary.
+    
+    Only one thread refreshes at a time. Threads that were waiting on that
+    refresh reuse its token rather than refreshing again.
+    
+    Args:
+        force_refresh: If True, force a token refresh regardless of expiry.
+        
+    Returns:
+        A valid OAuth access token.
+        
+    Raises:
+        ZohoAuthenticationError: If unable to obtain a token.
+    """
+    global _refresh_count
+    
+    # If we have a valid cached token and we're not forcing a refresh, use it
+    if not force_refresh:
+        access_token = _cached_access_token()
+        if access_token is not None:
+            logger.debug("Using cached access token")
+            return access_token
+    
+    refresh_count = _refresh_count
+    with _refresh_lock:
+        # Another thread may have refreshed while this one waited for the lock
+        if not force_refresh or _refresh_count != refresh_count:
+            access_token = _cached_access_token()
+            if access_token is not None:
+                logger.debug("Using access token refreshed by another thread")
+                return access_token
+        
+        access_token = _refresh_access_token()
+        _refresh_count += 1
+        return access_token
+
+
+async def _get_access_token_async(force_refresh: bool = False) -> str:
+    """
+    Get a valid OAuth access token without blocking the event loop.
+    
+    Coroutines that need a refresh while one is in flight await that refresh
+    instead of posting to the token endpoint themselves. The refresh, and any
+    read of the cache file, runs in a worker thread.
+    
+    Args:
+        force_refresh: If True, force a token refresh regardless of expiry.
+        
+    Returns:
+        A valid OAuth access token.
+        
+    Raises:
+        ZohoAuthenticationError: If unable to obtain a token.
+    """
+    global _refresh_future
+    
+    if not force_refresh:
+        # A valid in-memory token needs no I/O; otherwise read the file off the loop
+        if _is_token_valid(_token_cache):
+            access_token = _token_cache["access_token"]
+        else:
+            access_token = await asyncio.to_thread(_cached_access_token)
+        if access_token is not None:
+            logger.debug("Using cached access token")
+            return access_token
+    
+    # Join the refresh already in flight on this loop, or start one
+    loop = asyncio.get_running_loop()
+    refresh = _refresh_future
+    if refresh is None or refresh.get_loop() is not loop:
+        refresh = asyncio.ensure_future(asyncio.to_thread(_get_access_token, force_refresh))
+        _refresh_future = refresh
+        
+        def _forget(done: "asyncio.Future[str]") -> None:
+            global _refresh_future
+            if _refresh_future is done:
+                _refresh_future = None
+        
+        refresh.add_done_callback(_forget)
+    
+    # Shield the shared refresh so one cancelled caller doesn't cancel the rest
+    return await asyncio.shield(refresh)
+
+
+@functools.lru_cache(maxsize=2)
+def _auth_header(access_token: str) -> str:
+    """Build the Authorization header value, once per access token."""
+    return f"Zoho-oauthtoken {access_token}"
+
+
+def _new_async_client() -> httpx.AsyncClient:
+    """
+    Create an async HTTP client configured for the Zoho API.
+    
+    Requests are made relative to the API base URL, and the organization ID
+    is sent as a default query parameter that per-request params can override.
+    """
+    return httpx.AsyncClient(
+        base_url=API_BASE_URL,
+        params={"organization_id": ORG_ID} if ORG_ID else None,
+        timeout=settings.REQUEST_TIMEOUT,
+        http2=HTTP2_ENABLED,
+        limits=httpx.Limits(
+            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            max_connections=MAX_CONNECTIONS,
+        ),
+    )
+
+
+def _get_async_client() -> httpx.AsyncClient:
+    """
+    Get the shared async HTTP client, creating it on first use.
+    
+    Reusing one client keeps connections to Zoho alive between requests, so
+    only the first request to a host pays for the TCP and TLS handshake. A new
+    client is created if the previous one was closed or belongs to another
+    event loop. With the h2 package installed the client speaks HTTP/2, so
+    concurrent requests are multiplexed over a single connection.
+    
+    Sync requests run on a background loop, which keeps a client of its own.
+    
+    Returns:
+        The shared httpx.AsyncClient
+    """
+    global _async_client, _async_client_loop, _sync_client
+    
+    loop = asyncio.get_running_loop()
+    if loop is _sync_loop:
+        if _sync_client is None or _sync_client.is_closed:
+            _sync_client = _new_async_client()
+        return _sync_client
+    
+    if _async_client is None or _async_client.is_closed or _async_client_loop is not loop:
+        _async_client = _new_async_client()
+        _async_client_loop = loop
+    return _async_client
+
+
+def _get_sync_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the background event loop that runs sync requests, starting it on first use.
+    
+    Returns:
+        The running background loop
+    """
+    global _sync_loop, _sync_thread
+    
+    with _sync_loop_lock:
+        if _sync_loop is None or _sync_loop.is_closed():
+            _sync_loop = asyncio.new_event_loop()
+            _sync_thread = threading.Thread(
+                target=_sync_loop.run_forever, name="zoho-api-sync", daemon=True
+            )
+            _sync_thread.start()
+        return _sync_loop
+
+
+def _log_http_version(response: httpx.Response) -> None:
+    """Log the HTTP version negotiated with Zoho, once per process."""
+    global _http_version_logged
+    
+    if not _http_version_logged:
+        _http_version_logged = True
+        logger.debug(f"Zoho API connection negotiated {response.http_version}")
+
+
+def close_clients() -> None:
+    """
+    Close the shared HTTP clients and stop the background loop for sync requests.
+    
+    Called once the server's transport has stopped. The async client's event
+    loop has finished by then, so its reference is dropped rather than awaited;
+    the next request on either path opens a fresh client.
+    """
+    global _async_client, _async_client_loop, _sync_client, _sync_loop, _sync_thread, _auth_client
+    
+    with _refresh_lock:
+        if _auth_client is not None:
+            _auth_client.close()
+        _auth_client = None
+    
+    with _sync_loop_lock:
+        if _sync_loop is not None and not _sync_loop.is_closed():
+            if _sync_client is not None:
+                asyncio.run_coroutine_threadsafe(_sync_client.aclose(), _sync_loop).result()
+            _sync_loop.call_soon_threadsafe(_sync_loop.stop)
+            if _sync_thread is not None:
+                _sync_thread.join()
+            _sync_loop.close()
+        _sync_client = None
+        _sync_loop = None
+        _sync_thread = None
+    
+    _async_client = None
+    _async_client_loop = None
+
+
 def _handle_api_error(response: httpx.Response) -> None:
     """
     Handle error responses from the Zoho API.
@@ -376,7 +793,7 @@ def _handle_api_error(response: httpx.Response) -> None:
     status_code = response.status_code
     
     try:
-        data = response.json()
+        data = _json_loads(response.content)
         # Zoho API errors are typically in the format:
         # {"code": 1000, "message": "Error message"}
         message = data.get("message", "Unknown error")
@@ -399,16 +816,14 @@ def _handle_api_error(response: httpx.Response) -> None:
     if status_code == 401:
         raise ZohoAuthenticationError(status_code, message, code)
     elif status_code == 404:
-        resource_type = "Resource"  # Default value
-        resource_id = "unknown"     # Default value
-        
-        # Try to extract resource type and ID from the URL or response data
-        if hasattr(response, 'url'):
-            url_parts = str(response.url).split('/')
-            if len(url_parts) >= 2:
-                resource_type = url_parts[-2]
-                if len(url_parts) >= 1:
-                    resource_id = url_parts[-1].split('?')[0]
+        # Take the resource type and ID from the last two segments of the URL path
+        try:
+            path = response.url.path
+        except RuntimeError:  # Response has no request attached
+            path = ""
+        parent, _, tail = path.rpartition("/")
+        resource_id = tail or "unknown"
+        resource_type = parent.rpartition("/")[2] or "Resource"
         
         raise ResourceNotFoundError(resource_type, resource_id, details)
     elif status_code == 429:
@@ -444,9 +859,6 @@ async def zoho_api_request_async(
     Raises:
         ZohoAPIError: If the API returns an error
     """
-    if params is None:
-        params = {}
-    
     # Check global rate limit before making request
     wait_time = _check_global_rate_limit()
     if wait_time:
@@ -462,9 +874,48 @@ async def zoho_api_request_async(
         if cached_response is not None:
             logger.info(f"Returning cached response for {method} {endpoint}")
             return cached_response
+        
+        # Join an identical GET already in flight on this loop rather than sending another
+        loop = asyncio.get_running_loop()
+        pending = _pending_requests.get(cache_key)
+        if pending is None or pending.get_loop() is not loop:
+            pending = asyncio.ensure_future(_send_request_async(
+                method, endpoint, params, json_data, headers, retry_auth, request_id, cache_key
+            ))
+            _pending_requests[cache_key] = pending
+            
+            def _forget(done: "asyncio.Future[Dict[str, Any]]") -> None:
+                if _pending_requests.get(cache_key) is done:
+                    del _pending_requests[cache_key]
+            
+            pending.add_done_callback(_forget)
+        
+        # Shield the shared request so one cancelled caller doesn't cancel the rest
+        return await asyncio.shield(pending)
     
+    return await _send_request_async(
+        method, endpoint, params, json_data, headers, retry_auth, request_id, cache_key
+    )
+
+
+async def _send_request_async(
+    method: str,
+    endpoint: str,
+    params: Optional[Dict[str, Any]],
+    json_data: Optional[Dict[str, Any]],
+    headers: Optional[Dict[str, str]],
+    retry_auth: bool,
+    request_id: Optional[str],
+    cache_key: str,
+) -> Dict[str, Any]:
+    """
+    Send a request to the Zoho Books API, retrying where allowed.
+    
+    Takes the arguments of zoho_api_request_async, plus the cache key that
+    successful GET responses are stored under (empty for other methods).
+    """
     # Generate or use provided request ID for tracing
-    req_id = request_id or f"zoho-{uuid.uuid4().hex[:8]}"
+    req_id = request_id or f"zoho-{os.getpid():x}-{next(_request_ids):x}"
     set_request_context(request_id=req_id)
     
     # Convert user-friendly parameter values to API-expected values
@@ -474,113 +925,118 @@ async def zoho_api_request_async(
         elif params["sort_order"] == "descending":
             params["sort_order"] = "D"
     
-    # Add organization_id to every request
-    if "organization_id" not in params and ORG_ID:
-        params["organization_id"] = ORG_ID
-    
     # Ensure endpoint starts with /
     if not endpoint.startswith("/"):
         endpoint = f"/{endpoint}"
     
-    url = f"{API_BASE_URL}{endpoint}"
-    
     # Log the API call
     with log_api_call(method, endpoint, logger, include_request_body=True) as log_context:
+        # Bodies are only ever logged at debug level, so don't hold on to them otherwise
+        keep_bodies = logger.isEnabledFor(logging.DEBUG)
+        
         try:
             # Get access token for authentication
             try:
-                access_token = _get_access_token()
+                access_token = await _get_access_token_async()
             except ZohoAuthenticationError as e:
                 logger.error(f"Authentication error: {sanitize_error_message(str(e))}")
                 raise
             
-            # Prepare headers
+            # Prepare headers; the request ID makes each set unique
             request_headers = {
-                "Authorization": f"Zoho-oauthtoken {access_token}",
-                "Content-Type": "application/json",
+                **_STATIC_HEADERS,
+                "Authorization": _auth_header(access_token),
                 "X-Request-ID": req_id,
+                **(headers or {}),
             }
             
-            if headers:
-                request_headers.update(headers)
+            # Encode the body once; retries resend the same bytes
+            body = _json_dumps(json_data) if json_data is not None else None
             
             # Record request details in log context
-            if json_data is not None:
+            if keep_bodies and json_data is not None:
                 log_context["request_body"] = json_data
             
             # Implement retry logic with exponential backoff
             attempt = 0
             while attempt < MAX_RETRIES:
                 try:
-                    # Make the request
-                    async with httpx.AsyncClient(timeout=settings.REQUEST_TIMEOUT) as client:
-                        response = await client.request(
-                            method=method,
-                            url=url,
-                            params=params,
-                            json=json_data,
-                            headers=request_headers,
-                        )
-                        
-                        # Record response details
-                        log_context["status_code"] = response.status_code
-                        
-                        # Check if the request was successful
-                        if response.status_code >= 400:
-                            # Handle rate limiting (429)
-                            if response.status_code == 429:
-                                if attempt < MAX_RETRIES - 1:  # Don't wait on last attempt
-                                    wait_time = await _handle_rate_limit_async(response, attempt)
-                                    await asyncio.sleep(wait_time)
-                                    attempt += 1
-                                    continue  # Retry the request
-                                else:
-                                    # Final attempt failed, raise the error
-                                    _handle_api_error(response)
-                            
-                            # If we get a 401 Unauthorized and retry_auth is True,
-                            # refresh the token and try again
-                            elif response.status_code == 401 and retry_auth:
-                                logger.info("Received 401, refreshing token and retrying")
-                                _get_access_token(force_refresh=True)
-                                return await zoho_api_request_async(
-                                    method, endpoint, params, json_data, headers,
-                                    retry_auth=False, request_id=req_id
-                                )
-                            else:
-                                _handle_api_error(response)
+                    # Make the request over the shared connection pool
+                    client = _get_async_client()
+                    response = await client.request(
+                        method=method,
+                        url=endpoint,
+                        params=params or None,
+                        content=body,
+                        headers=request_headers,
+                    )
+                    
+                    # Record response details
+                    log_context["status_code"] = response.status_code
+                    _log_http_version(response)
+                    
+                    # Check if the request was successful
+                    if response.status_code >= 400:
+                        # Back off and retry rate limits (429) and server errors (5xx)
+                        if _should_retry(response, method, attempt):
+                            await asyncio.sleep(_retry_delay(response, attempt))
+                            attempt += 1
+                            continue  # Retry the request
                         
-                        # Parse JSON response
-                        try:
-                            result = response.json()
-                            log_context["response_body"] = result
-                            
-                            # Cache successful GET responses
-                            if cache_key and response.status_code == 200:
-                                _set_cached_response(cache_key, result)
-                            
-                            return result
-                        except Exception:  # Handle any JSON parsing errors
-                            # If the response is not JSON, return a dict with the text
+                        # If we get a 401 Unauthorized and retry_auth is True,
+                        # refresh the token and resend once with the new one
+                        elif response.status_code == 401 and retry_auth:
+                            logger.info("Received 401, refreshing token and retrying")
+                            retry_auth = False
+                            access_token = await _get_access_token_async(force_refresh=True)
+                            request_headers = {**request_headers, "Authorization": _auth_header(access_token)}
+                            continue  # Auth retries don't use up an attempt
+                        else:
+                            _handle_api_error(response)
+                    
+                    # Empty responses (204 No Content) have no body to parse
+                    if response.status_code == 204 or not response.content:
+                        result = {
+                            "status": "success",
+                            "message": "Operation completed successfully"
+                        }
+                        # Cache successful GET responses
+                        if cache_key:
+                            _set_cached_response(cache_key, result)
+                        return result
+                    
+                    # Return non-JSON bodies (e.g. HTML pages) as text without parsing
+                    content_type = response.headers.get("content-type", "")
+                    if content_type and "json" not in content_type:
+                        if keep_bodies:
                             log_context["response_text"] = response.text
-                            if response.status_code == 204:  # No Content
-                                result = {
-                                    "status": "success",
-                                    "message": "Operation completed successfully"
-                                }
-                                # Cache successful GET responses
-                                if cache_key:
-                                    _set_cached_response(cache_key, result)
-                                return result
-                            return {"text": response.text}
-                            
+                        return {"text": response.text}
+                    
+                    # Parse JSON response
+                    try:
+                        result = _json_loads(response.content)
+                    except ValueError:  # Handle JSON parsing errors
+                        # If the response is not JSON, return a dict with the text
+                        if keep_bodies:
+                            log_context["response_text"] = response.text
+                        return {"text": response.text}
+                    
+                    if keep_bodies:
+                        log_context["response_body"] = result
+                    
+                    # Cache successful GET responses
+                    if cache_key and response.status_code == 200:
+                        _set_cached_response(cache_key, result)
+                    
+                    return result
+                        
                 except httpx.HTTPStatusError:
                     # This shouldn't happen as we handle status codes above
                     raise
                 except (httpx.RequestError, httpx.TimeoutException) as e:
                     # Network errors can be retried
                     if attempt < MAX_RETRIES - 1:
-                        wait_time = min(INITIAL_BACKOFF * (BACKOFF_MULTIPLIER ** attempt), MAX_BACKOFF)
+                        wait_time = _backoff_delay(attempt)
                         logger.warning(
                             f"Request error (attempt {attempt + 1}/{MAX_RETRIES}): {str(e)}. "
                             f"Retrying in {wait_time:.1f}s..."
@@ -613,6 +1069,9 @@ def zoho_api_request(
     """
     Make a synchronous request to the Zoho Books API.
     
+    This blocks on zoho_api_request_async, run on a background event loop,
+    so both variants share the same retry, caching, and token handling.
+    
     Args:
         method: HTTP method (GET, POST, PUT, DELETE)
         endpoint: API endpoint, starting with /
@@ -627,101 +1086,27 @@ def zoho_api_request(
         
     Raises:
         ZohoAPIError: If the API returns an error
+        RuntimeError: If called from a coroutine running on the background loop
     """
-    if params is None:
-        params = {}
-    
-    # Generate or use provided request ID for tracing
-    req_id = request_id or f"zoho-{uuid.uuid4().hex[:8]}"
-    set_request_context(request_id=req_id)
-    
-    # Convert user-friendly parameter values to API-expected values
-    if params and "sort_order" in params:
-        if params["sort_order"] == "ascending":
-            params["sort_order"] = "A"
-        elif params["sort_order"] == "descending":
-            params["sort_order"] = "D"
-    
-    # Add organization_id to every request
-    if "organization_id" not in params and ORG_ID:
-        params["organization_id"] = ORG_ID
-    
-    # Ensure endpoint starts with /
-    if not endpoint.startswith("/"):
-        endpoint = f"/{endpoint}"
+    # Blocking the background loop on its own request would never return
+    try:
+        running_loop = asyncio.get_running_loop()
+    except RuntimeError:
+        running_loop = None
+    if running_loop is not None and running_loop is _sync_loop:
+        raise RuntimeError(
+            "zoho_api_request cannot run on the background request loop; "
+            "await zoho_api_request_async instead"
+        )
     
-    url = f"{API_BASE_URL}{endpoint}"
+    request = zoho_api_request_async(
+        method, endpoint, params, json, headers,
+        retry_auth=retry_auth, request_id=request_id,
+    )
     
-    # Log the API call
-    with log_api_call(method, endpoint, logger, include_request_body=True) as log_context:
-        try:
-            # Get access token for authentication
-            try:
-                access_token = _get_access_token()
-            except ZohoAuthenticationError as e:
-                logger.error(f"Authentication error: {sanitize_error_message(str(e))}")
-                raise
-            
-            # Prepare headers
-            request_headers = {
-                "Authorization": f"Zoho-oauthtoken {access_token}",
-                "Content-Type": "application/json",
-                "X-Request-ID": req_id,
-            }
-            
-            if headers:
-                request_headers.update(headers)
-            
-            # Record request details in log context
-            if json is not None:
-                log_context["request_body"] = json
-            
-            # Make the request
-            with httpx.Client(timeout=settings.REQUEST_TIMEOUT) as client:
-                response = client.request(
-                    method=method,
-                    url=url,
-                    params=params,
-                    json=json,
-                    headers=request_headers,
-                )
-                
-                # Record response details
-                log_context["status_code"] = response.status_code
-                
-                # Check if the request was successful
-                if response.status_code >= 400:
-                    # If we get a 401 Unauthorized and retry_auth is True,
-                    # refresh the token and try again
-                    if response.status_code == 401 and retry_auth:
-                        logger.info("Received 401, refreshing token and retrying")
-                        _get_access_token(force_refresh=True)
-                        return zoho_api_request(
-                            method, endpoint, params, json, headers,
-                            retry_auth=False, request_id=req_id
-                        )
-                    else:
-                        _handle_api_error(response)
-                
-                # Parse JSON response
-                try:
-                    result = response.json()
-                    log_context["response_body"] = result
-                    return result
-                except Exception:  # Handle any JSON parsing errors
-                    # If the response is not JSON, return a dict with the text
-                    log_context["response_text"] = response.text
-                    if response.status_code == 204:  # No Content
-                        return {
-                            "status": "success",
-                            "message": "Operation completed successfully"
-                        }
-                    return {"text": response.text}
-                    
-        except (httpx.RequestError, httpx.TimeoutException) as e:
-            error_msg = f"Request error: {str(e)}"
-            logger.error(error_msg)
-            raise ZohoRequestError(500, error_msg)
+    # Run on the background loop, so this works whether or not the caller
+    # already has an event loop running, and sync requests share a pool
+    return asyncio.run_coroutine_threadsafe(request, _get_sync_loop()).result()
 
 
 # Utility function to validate Zoho credentials
@@ -729,16 +1114,32 @@ def validate_credentials() -> Tuple[bool, Optional[str]]:
     """
     Validate the Zoho API credentials.
     
+    A successful validation is reused for VALIDATION_TTL seconds while the
+    organization ID and refresh token stay the same, so repeated checks don't
+    spend Zoho API calls. Failures are always re-checked.
+    
     Returns:
         A tuple of (success: bool, error_message: Optional[str])
     """
+    global _last_validation
+    
+    credentials = (ORG_ID, settings.ZOHO_REFRESH_TOKEN)
+    if (
+        _last_validation is not None
+        and _last_validation[0] == credentials
+        and _last_validation[1] > time.monotonic()
+    ):
+        logger.debug("Using cached credential validation")
+        return True, None
+    
     logger.info("Validating Zoho Books API credentials")
     try:
         # Check if required settings are present
         settings.validate()
         
-        # Try to get an access token
-        _get_access_token(force_refresh=True)
+        # Try to get an access token; a stale one is refreshed, and a
+        # rejected one is refreshed by the request's 401 handling
+        _get_access_token()
         
         # Make a simple request to test the token
         with log_api_call("GET", "/organizations", logger) as log_context:
@@ -751,14 +1152,14 @@ def validate_credentials() -> Tuple[bool, Optional[str]]:
             
             # Check if our organization ID exists in the response
             orgs = response.get("organizations", [])
-            org_ids = [org.get("organization_id") for org in orgs]
             
-            if ORG_ID not in org_ids:
+            if not any(org.get("organization_id") == ORG_ID for org in orgs):
                 error_msg = f"Organization ID {ORG_ID} not found in Zoho Books account."
                 logger.error(error_msg)
                 return False, error_msg
             
             logger.info("Zoho Books API credentials validated successfully")
+            _last_validation = (credentials, time.monotonic() + VALIDATION_TTL)
             return True, None
         
     except (ZohoAuthenticationError, ZohoRequestError) as e:
@@ -17,7 +17,6 @@ if TYPE_CHECKING:
         parameters: Dict[str, Any]
 
 from zoho_mcp.models.contacts import (
-    ContactDeleteInput,
     CustomerInput,
     VendorInput,
     ContactResponse,
@@ -27,6 +26,12 @@ from zoho_mcp.tools.api import zoho_api_request_async
 
 logger = logging.getLogger(__name__)
 
+# List endpoint for each contact_type; anything else lists all contacts
+_CONTACT_ENDPOINTS: Dict[str, str] = {
+    "customer": "/contacts?contact_type=customer",
+    "vendor": "/contacts?contact_type=vendor",
+}
+
 
 async def list_contacts(
     contact_type: str = "all",
@@ -51,8 +56,8 @@ async def list_contacts(
         A paginated list of contacts matching the filters
     """
     logger.info(
-        f"Listing contacts with type={contact_type}, page={page}, " 
-        f"search_text={search_text or 'None'}"
+        "Listing contacts with type=%s, page=%s, search_text=%s",
+        contact_type, page, search_text or "None",
     )
     
     params = {
@@ -72,38 +77,28 @@ async def list_contacts(
         params["search_text"] = search_text
     
     # Set the endpoint based on contact_type
-    if contact_type == "customer":
-        endpoint = "/contacts?contact_type=customer"
-    elif contact_type == "vendor":
-        endpoint = "/contacts?contact_type=vendor"
-    else:
-        endpoint = "/contacts"
+    endpoint = _CONTACT_ENDPOINTS.get(contact_type, "/contacts")
     
-    try:
-        response = await zoho_api_request_async("GET", endpoint, params=params)
-        
-        # Parse the response
-        contacts_response = ContactsListResponse.model_validate(response)
-        
-        # Construct paginated response
-        result = {
-            "page": page,
-            "page_size": page_size,
-            "has_more_page": response.get("page_context", {}).get("has_more_page", False),
-            "contacts": contacts_response.contacts or [],
-            "message": contacts_response.message,
-        }
-        
-        # Add total count if available
-        if "page_context" in response and "total" in response["page_context"]:
-            result["total"] = response["page_context"]["total"]
-            
-        logger.info(f"Retrieved {len(result['contacts'])} contacts")
-        return result
+    response = await zoho_api_request_async("GET", endpoint, params=params)
+    
+    # Parse the response
+    contacts_response = ContactsListResponse.model_validate(response)
+    
+    # Construct paginated response
+    result = {
+        "page": page,
+        "page_size": page_size,
+        "has_more_page": response.get("page_context", {}).get("has_more_page", False),
+        "contacts": contacts_response.contacts or [],
+        "message": contacts_response.message,
+    }
+    
+    # Add total count if available
+    if "page_context" in response and "total" in response["page_context"]:
+        result["total"] = response["page_context"]["total"]
         
-    except Exception as e:
-        logger.error(f"Error listing contacts: {str(e)}")
-        raise
+    logger.info("Retrieved %d contacts", len(result["contacts"]))
+    return result
 
 
 async def create_customer(**kwargs) -> Dict[str, Any]:
@@ -132,34 +127,32 @@ async def create_customer(**kwargs) -> Dict[str, Any]:
     Raises:
         Exception: If validation fails or the API request fails
     """
-    logger.info(f"Creating customer with name: {kwargs.get('contact_name')}")
+    logger.info("Creating customer with name: %s", kwargs.get("contact_name"))
     
     # Convert the kwargs to a CustomerInput model for validation
     try:
         customer_data = CustomerInput.model_validate(kwargs)
     except Exception as e:
-        logger.error(f"Validation error creating customer: {str(e)}")
+        logger.error("Validation error creating customer: %s", e)
         raise ValueError(f"Invalid customer data: {str(e)}")
     
     # Prepare data for API request
     data = customer_data.model_dump(exclude_none=True)
     
-    try:
-        response = await zoho_api_request_async("POST", "/contacts", json_data=data)
-        
-        # Parse the response
-        contact_response = ContactResponse.model_validate(response)
-        
-        logger.info(f"Customer created successfully: {contact_response.contact.get('contact_id') if contact_response.contact else 'Unknown ID'}")
-        
-        return {
-            "contact": contact_response.contact,
-            "message": contact_response.message or "Customer created successfully",
-        }
-        
-    except Exception as e:
-        logger.error(f"Error creating customer: {str(e)}")
-        raise
+    response = await zoho_api_request_async("POST", "/contacts", json_data=data)
+    
+    # Parse the response
+    contact_response = ContactResponse.model_validate(response)
+    
+    logger.info(
+        "Customer created successfully: %s",
+        contact_response.contact.get("contact_id") if contact_response.contact else "Unknown ID",
+    )
+    
+    return {
+        "contact": contact_response.contact,
+        "message": contact_response.message or "Customer created successfully",
+    }
 
 
 async def create_vendor(**kwargs) -> Dict[str, Any]:
@@ -188,34 +181,32 @@ async def create_vendor(**kwargs) -> Dict[str, Any]:
     Raises:
         Exception: If validation fails or the API request fails
     """
-    logger.info(f"Creating vendor with name: {kwargs.get('contact_name')}")
+    logger.info("Creating vendor with name: %s", kwargs.get("contact_name"))
     
     # Convert the kwargs to a VendorInput model for validation
     try:
         vendor_data = VendorInput.model_validate(kwargs)
     except Exception as e:
-        logger.error(f"Validation error creating vendor: {str(e)}")
+        logger.error("Validation error creating vendor: %s", e)
         raise ValueError(f"Invalid vendor data: {str(e)}")
     
     # Prepare data for API request
     data = vendor_data.model_dump(exclude_none=True)
     
-    try:
-        response = await zoho_api_request_async("POST", "/contacts", json_data=data)
-        
-        # Parse the response
-        contact_response = ContactResponse.model_validate(response)
-        
-        logger.info(f"Vendor created successfully: {contact_response.contact.get('contact_id') if contact_response.contact else 'Unknown ID'}")
-        
-        return {
-            "contact": contact_response.contact,
-            "message": contact_response.message or "Vendor created successfully",
-        }
-        
-    except Exception as e:
-        logger.error(f"Error creating vendor: {str(e)}")
-        raise
+    response = await zoho_api_request_async("POST", "/contacts", json_data=data)
+    
+    # Parse the response
+    contact_response = ContactResponse.model_validate(response)
+    
+    logger.info(
+        "Vendor created successfully: %s",
+        contact_response.contact.get("contact_id") if contact_response.contact else "Unknown ID",
+    )
+    
+    return {
+        "contact": contact_response.contact,
+        "message": contact_response.message or "Vendor created successfully",
+    }
 
 
 async def get_contact(contact_id: str) -> Dict[str, Any]:
@@ -231,31 +222,26 @@ async def get_contact(contact_id: str) -> Dict[str, Any]:
     Raises:
         Exception: If the API request fails
     """
-    logger.info(f"Getting contact with ID: {contact_id}")
+    logger.info("Getting contact with ID: %s", contact_id)
     
-    try:
-        response = await zoho_api_request_async("GET", f"/contacts/{contact_id}")
-        
-        # Parse the response
-        contact_response = ContactResponse.model_validate(response)
-        
-        if not contact_response.contact:
-            logger.warning(f"Contact not found: {contact_id}")
-            return {
-                "message": "Contact not found",
-                "contact": None,
-            }
-        
-        logger.info(f"Contact retrieved successfully: {contact_id}")
-        
+    response = await zoho_api_request_async("GET", f"/contacts/{contact_id}")
+    
+    # Parse the response
+    contact_response = ContactResponse.model_validate(response)
+    
+    if not contact_response.contact:
+        logger.warning("Contact not found: %s", contact_id)
         return {
-            "contact": contact_response.contact,
-            "message": contact_response.message or "Contact retrieved successfully",
+            "message": "Contact not found",
+            "contact": None,
         }
-        
-    except Exception as e:
-        logger.error(f"Error getting contact: {str(e)}")
-        raise
+    
+    logger.info("Contact retrieved successfully: %s", contact_id)
+    
+    return {
+        "contact": contact_response.contact,
+        "message": contact_response.message or "Contact retrieved successfully",
+    }
 
 
 async def delete_contact(contact_id: str) -> Dict[str, Any]:
@@ -271,30 +257,22 @@ async def delete_contact(contact_id: str) -> Dict[str, Any]:
     Raises:
         Exception: If validation fails or the API request fails
     """
-    logger.info(f"Deleting contact with ID: {contact_id}")
+    logger.info("Deleting contact with ID: %s", contact_id)
     
-    # Validate input
-    try:
-        # We validate the contact_id but don't need to use the result
-        ContactDeleteInput(contact_id=contact_id)
-    except Exception as e:
-        logger.error(f"Validation error deleting contact: {str(e)}")
-        raise ValueError(f"Invalid contact ID: {str(e)}")
+    # Validate input; a plain check is enough for a single ID string
+    if not isinstance(contact_id, str) or not contact_id:
+        logger.error("Validation error deleting contact: %r is not a contact ID", contact_id)
+        raise ValueError(f"Invalid contact ID: {contact_id!r}")
     
-    try:
-        response = await zoho_api_request_async("DELETE", f"/contacts/{contact_id}")
-        
-        # The API response for delete operations might be minimal
-        # so we construct a standardized response
-        return {
-            "success": True,
-            "message": response.get("message", "Contact deleted successfully"),
-            "contact_id": contact_id,
-        }
-        
-    except Exception as e:
-        logger.error(f"Error deleting contact: {str(e)}")
-        raise
+    response = await zoho_api_request_async("DELETE", f"/contacts/{contact_id}")
+    
+    # The API response for delete operations might be minimal
+    # so we construct a standardized response
+    return {
+        "success": True,
+        "message": response.get("message", "Contact deleted successfully"),
+        "contact_id": contact_id,
+    }
 
 
 async def update_contact(contact_id: str, **kwargs) -> Dict[str, Any]:
@@ -324,7 +302,7 @@ async def update_contact(contact_id: str, **kwargs) -> Dict[str, Any]:
     Raises:
         Exception: If validation fails or the API request fails
     """
-    logger.info(f"Updating contact with ID: {contact_id}")
+    logger.info("Updating contact with ID: %s", contact_id)
     
     # Prepare data for API request - only include fields that were provided
     data = {k: v for k, v in kwargs.items() if v is not None}
@@ -332,22 +310,17 @@ async def update_contact(contact_id: str, **kwargs) -> Dict[str, Any]:
     if not data:
         raise ValueError("No fields provided to update")
     
-    try:
-        response = await zoho_api_request_async("PUT", f"/contacts/{contact_id}", json_data=data)
-        
-        # Parse the response
-        contact_response = ContactResponse.model_validate(response)
-        
-        logger.info(f"Contact updated successfully: {contact_id}")
-        
-        return {
-            "contact": contact_response.contact,
-            "message": contact_response.message or "Contact updated successfully",
-        }
-        
-    except Exception as e:
-        logger.error(f"Error updating contact: {str(e)}")
-        raise
+    response = await zoho_api_request_async("PUT", f"/contacts/{contact_id}", json_data=data)
+    
+    # Parse the response
+    contact_response = ContactResponse.model_validate(response)
+    
+    logger.info("Contact updated successfully: %s", contact_id)
+    
+    return {
+        "contact": contact_response.contact,
+        "message": contact_response.message or "Contact updated successfully",
+    }
 
 
 async def email_statement(
@@ -377,7 +350,9 @@ async def email_statement(
     Raises:
         Exception: If the API request fails
     """
-    logger.info(f"Sending statement to contact: {contact_id} for period {from_date} to {to_date}")
+    logger.info(
+        "Sending statement to contact: %s for period %s to %s", contact_id, from_date, to_date
+    )
     
     # Prepare email parameters
     params = {
@@ -396,26 +371,21 @@ async def email_statement(
     if body:
         email_data["body"] = body
     
-    try:
-        response = await zoho_api_request_async(
-            "POST", 
-            f"/contacts/{contact_id}/statements/email",
-            params=params,
-            json_data=email_data if email_data else None
-        )
-        
-        logger.info(f"Statement emailed successfully to contact: {contact_id}")
-        
-        return {
-            "success": True,
-            "message": response.get("message", "Statement emailed successfully"),
-            "contact_id": contact_id,
-            "period": f"{from_date} to {to_date}",
-        }
-        
-    except Exception as e:
-        logger.error(f"Error emailing statement: {str(e)}")
-        raise
+    response = await zoho_api_request_async(
+        "POST", 
+        f"/contacts/{contact_id}/statements/email",
+        params=params,
+        json_data=email_data if email_data else None
+    )
+    
+    logger.info("Statement emailed successfully to contact: %s", contact_id)
+    
+    return {
+        "success": True,
+        "message": response.get("message", "Statement emailed successfully"),
+        "contact_id": contact_id,
+        "period": f"{from_date} to {to_date}",
+    }
 
 
 # Define metadata for tools that can be used by the MCP server
@@ -9,7 +9,8 @@ and transport-specific error handling.
 
 import logging
 import argparse
-from typing import Any, Dict, Optional, Tuple, Callable, TypeVar, cast
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple, Callable, TypeVar, cast
 
 from mcp.server.fastmcp import FastMCP
 
@@ -35,6 +36,29 @@ class TransportInitializationError(TransportError):
     pass
 
 
+SERVER_VERSION = "Zoho MCP Server v0.1.0"
+
+
+class _SelfTestAction(argparse.Action):
+    """
+    Argparse action that prints usage and version information, then exits.
+
+    Lets packaging smoke tests probe the CLI with a single process spawn
+    instead of separate --help and --version invocations.
+    """
+
+    def __init__(self, option_strings: Any, dest: str = argparse.SUPPRESS,
+                 default: str = argparse.SUPPRESS, help: Optional[str] = None) -> None:
+        super().__init__(option_strings=option_strings, dest=dest,
+                         default=default, nargs=0, help=help)
+
+    def __call__(self, parser: argparse.ArgumentParser, namespace: argparse.Namespace,
+                 values: Any, option_string: Optional[str] = None) -> None:
+        parser.print_usage()
+        print(f"{SERVER_VERSION}\nselftest: ok")
+        parser.exit(0)
+
+
 def setup_stdio_transport(
     mcp_server: FastMCP, **kwargs: Any
 ) -> None:
@@ -139,6 +163,15 @@ def setup_websocket_transport(
     raise TransportInitializationError(error_msg)
 
 
+# Transport type -> function that configures and starts it
+_TRANSPORT_HANDLERS: Mapping[str, Callable[..., None]] = MappingProxyType({
+    "stdio": setup_stdio_transport,
+    "http": setup_http_transport,
+    "websocket": setup_websocket_transport,
+})
+_SUPPORTED_TRANSPORTS = ", ".join(_TRANSPORT_HANDLERS)
+
+
 def get_transport_handler(transport_type: str) -> Callable[[FastMCP], None]:
     """
     Get the appropriate transport handler function based on the transport type.
@@ -152,22 +185,15 @@ def get_transport_handler(transport_type: str) -> Callable[[FastMCP], None]:
     Raises:
         TransportConfigurationError: If the transport type is not supported
     """
-    transport_handlers = {
-        "stdio": setup_stdio_transport,
-        "http": setup_http_transport,
-        "websocket": setup_websocket_transport,
-    }
-
-    if transport_type not in transport_handlers:
-        supported = ", ".join(transport_handlers.keys())
+    try:
+        handler = _TRANSPORT_HANDLERS[transport_type]
+    except KeyError:
         msg = f"Unsupported transport type: {transport_type}. "
-        msg += f"Supported types are: {supported}"
-        raise TransportConfigurationError(msg)
+        msg += f"Supported types are: {_SUPPORTED_TRANSPORTS}"
+        raise TransportConfigurationError(msg) from None
 
     # Cast the function to the expected callable type
-    handler = cast(Callable[[FastMCP], None],
-                   transport_handlers[transport_type])
-    return handler
+    return cast(Callable[[FastMCP], None], handler)
 
 
 def configure_transport_from_args(
@@ -228,7 +254,12 @@ def setup_argparser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--version",
         action="version",
-        version="Zoho MCP Server v0.1.0"
+        version=SERVER_VERSION
+    )
+    parser.add_argument(
+        "--selftest",
+        action=_SelfTestAction,
+        help="Print usage and version information and exit"
     )
 
     # Transport mode arguments